@@ -129,16 +129,17 @@ https://secure-proxy.example.com:8080
         # Should be added to working proxies
         self.assertIn(proxy, self.proxy_manager.working_proxies)
         
-    @patch('requests.get')
-    def test_proxy_validation(self, mock_get):
+    @patch('socket.create_connection')
+    @patch('requests.Session.head')
+    def test_proxy_validation(self, mock_head, mock_connect):
         """Test single proxy validation"""
         if not self.proxy_manager.proxies:
             self.skipTest("No proxies loaded for testing")
             
         # Mock successful response
         mock_response = Mock()
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
+        mock_response.status_code = 204
+        mock_head.return_value = mock_response
         
         proxy = self.proxy_manager.proxies[0]
         result = self.proxy_manager.validate_proxy(proxy)
@@ -149,7 +150,7 @@ https://secure-proxy.example.com:8080
         # Proxy should be marked as working
         self.assertIn(proxy, self.proxy_manager.working_proxies)
         
-    @patch('requests.get')
+    @patch('requests.Session.head')
     def test_proxy_validation_failure(self, mock_get):
         """Test proxy validation failure"""
         if not self.proxy_manager.proxies:
@@ -285,7 +286,7 @@ https://secure-proxy.example.com:8080
             
         proxy = self.proxy_manager.proxies[0]
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             # Mock successful connectivity test
             mock_response = Mock()
             mock_response.status_code = 200
@@ -103,7 +103,7 @@ class TestEmailScraper(unittest.TestCase):
             valid_statuses = ['found', 'not_found', 'potential_match', 'error']
             self.assertIn(result['status'], valid_statuses)
             
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_google_site_search(self, mock_get):
         """Test Google site search functionality"""
         # Mock successful response
@@ -120,6 +120,7 @@ class TestEmailScraper(unittest.TestCase):
             </body>
         </html>
         '''
+        mock_response.text = mock_response.content
         mock_get.return_value = mock_response
         
         test_platform = {
@@ -133,7 +134,7 @@ class TestEmailScraper(unittest.TestCase):
         self.assertEqual(result['search_method'], 'google_site_search')
         self.assertIn('matches', result)
         
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_direct_platform_search(self, mock_get):
         """Test direct platform search"""
         mock_response = Mock()
@@ -184,7 +185,7 @@ class TestEmailScraper(unittest.TestCase):
             
     def test_advanced_google_search(self):
         """Test advanced Google search with variations"""
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = '''
@@ -198,6 +199,7 @@ class TestEmailScraper(unittest.TestCase):
                 </body>
             </html>
             '''
+            mock_response.text = mock_response.content
             mock_get.return_value = mock_response
             
             test_platform = {
@@ -283,10 +285,11 @@ class TestEmailScraper(unittest.TestCase):
             
     def test_empty_search_results(self):
         """Test handling of empty search results"""
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = '<html><body>No results found</body></html>'
+            mock_response.text = mock_response.content
             mock_get.return_value = mock_response
             
             test_platform = {
@@ -7,428 +7,220 @@ Date: September 2025
 
 import json
 import csv
-import xml.etree.ElementTree as ET
 import pandas as pd
 import os
 import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-from xml.dom import minidom
+from collections import OrderedDict
 
+from jinja2 import Environment, select_autoescape
+
+try:
+    from lxml import etree as ET
+    _HAVE_LXML = True
+except ImportError:
+    # Stdlib fallback: the C accelerator is picked up automatically and
+    # ET.indent gives O(N) in-tree pretty-printing without a minidom round trip
+    import xml.etree.ElementTree as ET  # type: ignore[no-redef]
+    _HAVE_LXML = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class _NormalizedResult:
+    """Single-pass flattened view of a results dict.
+
+    Collects per-platform-type aggregates and the list of all matches in one
+    traversal so repeated summary/export calls on the same results object
+    don't re-walk the nested structure.
+    """
+
+    def __init__(self, results: Dict[str, Any]):
+        self.email = results.get('email', '')
+        self.timestamp = results.get('timestamp', '')
+        self.summary = results.get('summary', {})
+        self.platform_results: Dict[str, List[Dict[str, Any]]] = results.get('results', {})
+        self.platform_stats: Dict[str, Dict[str, int]] = {}
+        self.matches: List[Dict[str, Any]] = []
 
-class OutputFormatter:
-    """Handles multiple output formats for search results"""
-    
-    def __init__(self):
-        self.supported_formats = ['json', 'csv', 'xml', 'txt', 'html', 'xlsx']
-        
-    def save_results(self, results: Dict[str, Any], filename: str, format_type: str = 'json') -> str:
-        """Save results in specified format"""
-        if format_type not in self.supported_formats:
-            raise ValueError(f"Unsupported format: {format_type}. Supported: {self.supported_formats}")
-            
-        # Ensure filename doesn't have extension
-        base_filename = filename.rsplit('.', 1)[0]
-        
-        # Create results directory if it doesn't exist
-        results_dir = os.path.dirname(base_filename) or 'results'
-        os.makedirs(results_dir, exist_ok=True)
-        
-        # Format-specific saving
-        if format_type == 'json':
-            return self._save_json(results, base_filename)
-        elif format_type == 'csv':
-            return self._save_csv(results, base_filename)
-        elif format_type == 'xml':
-            return self._save_xml(results, base_filename)
-        elif format_type == 'txt':
-            return self._save_txt(results, base_filename)
-        elif format_type == 'html':
-            return self._save_html(results, base_filename)
-        elif format_type == 'xlsx':
-            return self._save_xlsx(results, base_filename)
-        else:
-            raise ValueError(f"Format {format_type} not implemented")
-            
-    def _save_json(self, results: Dict[str, Any], base_filename: str) -> str:
-        """Save results as JSON"""
-        filename = f"{base_filename}.json"
-        
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False, default=str)
-                
-            logging.info(f"Results saved to JSON: {filename}")
-            return filename
-            
-        except Exception as e:
-            logging.error(f"Error saving JSON: {e}")
-            raise
-            
-    def _save_csv(self, results: Dict[str, Any], base_filename: str) -> str:
-        """Save results as CSV"""
-        filename = f"{base_filename}.csv"
-        
-        try:
-            # Flatten results for CSV format
-            flattened_data = self._flatten_results_for_tabular(results)
-            
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                if flattened_data:
-                    writer = csv.DictWriter(f, fieldnames=flattened_data[0].keys())
-                    writer.writeheader()
-                    writer.writerows(flattened_data)
-                else:
-                    # Empty results
-                    writer = csv.writer(f)
-                    writer.writerow(['email', 'timestamp', 'status', 'message'])
-                    writer.writerow([
-                        results.get('email', ''), 
-                        results.get('timestamp', ''), 
-                        'no_results', 
-                        'No matches found'
-                    ])
-                    
-            logging.info(f"Results saved to CSV: {filename}")
-            return filename
-            
-        except Exception as e:
-            logging.error(f"Error saving CSV: {e}")
-            raise
-            
-    def _save_xml(self, results: Dict[str, Any], base_filename: str) -> str:
-        """Save results as XML"""
-        filename = f"{base_filename}.xml"
-        
-        try:
-            root = ET.Element('osint_results')
-            
-            # Add metadata
-            metadata = ET.SubElement(root, 'metadata')
-            ET.SubElement(metadata, 'email').text = results.get('email', '')
-            ET.SubElement(metadata, 'timestamp').text = results.get('timestamp', '')
-            ET.SubElement(metadata, 'tool_version').text = '1.0'
-            
-            # Add summary
-            summary_data = results.get('summary', {})
-            summary_elem = ET.SubElement(root, 'summary')
-            for key, value in summary_data.items():
-                ET.SubElement(summary_elem, key).text = str(value)
-                
-            # Add results
-            results_elem = ET.SubElement(root, 'search_results')
-            
-            for platform_type, platform_results in results.get('results', {}).items():
-                platform_elem = ET.SubElement(results_elem, 'platform_type', name=platform_type)
-                
-                for result in platform_results:
-                    result_elem = ET.SubElement(platform_elem, 'result')
-                    
-                    # Add basic result info
-                    ET.SubElement(result_elem, 'platform').text = result.get('platform', '')
-                    ET.SubElement(result_elem, 'url').text = result.get('url', '')
-                    ET.SubElement(result_elem, 'status').text = result.get('status', '')
-                    ET.SubElement(result_elem, 'search_method').text = result.get('search_method', '')
-                    ET.SubElement(result_elem, 'search_time').text = result.get('search_time', '')
-                    
-                    # Add matches
-                    matches_elem = ET.SubElement(result_elem, 'matches')
-                    for match in result.get('matches', []):
-                        match_elem = ET.SubElement(matches_elem, 'match')
-                        for key, value in match.items():
-                            ET.SubElement(match_elem, key).text = str(value)
-                            
-                    # Add error if present
-                    if result.get('error'):
-                        ET.SubElement(result_elem, 'error').text = result.get('error', '')
-                        
-            # Pretty print XML
-            xml_str = ET.tostring(root, encoding='unicode')
-            pretty_xml = minidom.parseString(xml_str).toprettyxml(indent="  ")
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(pretty_xml)
-                
-            logging.info(f"Results saved to XML: {filename}")
-            return filename
-            
-        except Exception as e:
-            logging.error(f"Error saving XML: {e}")
-            raise
-            
-    def _save_txt(self, results: Dict[str, Any], base_filename: str) -> str:
-        """Save results as plain text report"""
-        filename = f"{base_filename}.txt"
-        
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                # Header
-                f.write("="*80 + "\n")
-                f.write("EMAIL OSINT INVESTIGATION REPORT\n")
-                f.write("="*80 + "\n\n")
-                
-                # Basic info
-                f.write(f"Target Email: {results.get('email', 'Unknown')}\n")
-                f.write(f"Search Date: {results.get('timestamp', 'Unknown')}\n")
-                f.write(f"Tool Version: 1.0 (September 2025)\n\n")
-                
-                # Summary
-                summary = results.get('summary', {})
-                f.write("SEARCH SUMMARY\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"Total Platforms Searched: {summary.get('total_platforms_searched', 0)}\n")
-                f.write(f"Platforms with Hits: {summary.get('platforms_with_hits', 0)}\n")
-                f.write(f"Platforms with Errors: {summary.get('platforms_with_errors', 0)}\n")
-                f.write(f"Success Rate: {summary.get('hit_rate_percentage', 0):.2f}%\n\n")
-                
-                # Detailed results
-                f.write("DETAILED FINDINGS\n")
-                f.write("-" * 40 + "\n\n")
-                
-                for platform_type, platform_results in results.get('results', {}).items():
-                    f.write(f"[{platform_type.upper()}]\n")
-                    f.write("="*60 + "\n")
-                    
-                    for result in platform_results:
-                        status = result.get('status', 'unknown')
-                        platform_name = result.get('platform', 'Unknown')
-                        
-                        if status == 'found':
-                            f.write(f"✓ FOUND: {platform_name}\n")
-                        elif status == 'potential_match':
-                            f.write(f"? POTENTIAL: {platform_name}\n")
-                        elif status == 'not_found':
-                            f.write(f"✗ NOT FOUND: {platform_name}\n")
-                        elif status == 'error':
-                            f.write(f"! ERROR: {platform_name}\n")
-                        else:
-                            f.write(f"- UNKNOWN: {platform_name}\n")
-                            
-                        f.write(f"  URL: {result.get('url', 'N/A')}\n")
-                        f.write(f"  Method: {result.get('search_method', 'N/A')}\n")
-                        f.write(f"  Time: {result.get('search_time', 'N/A')}\n")
-                        
-                        # Show matches
-                        matches = result.get('matches', [])
-                        if matches:
-                            f.write(f"  Matches: {len(matches)}\n")
-                            for i, match in enumerate(matches[:3], 1):  # Show first 3 matches
-                                f.write(f"    [{i}] {match.get('title', 'No title')}\n")
-                                snippet = match.get('snippet', match.get('content', ''))
-                                if snippet:
-                                    f.write(f"        {snippet[:100]}{'...' if len(snippet) > 100 else ''}\n")
-                                if match.get('url'):
-                                    f.write(f"        URL: {match['url']}\n")
-                                f.write(f"        Confidence: {match.get('confidence', 0):.2f}\n")
-                                
-                        # Show errors
-                        if result.get('error'):
-                            f.write(f"  Error: {result['error']}\n")
-                            
-                        f.write("\n")
-                        
-                    f.write("\n")
-                    
-                # Footer
-                f.write("="*80 + "\n")
-                f.write("Report generated by Advanced Email OSINT Tool v1.0\n")
-                f.write("For educational and legitimate security research only\n")
-                f.write("="*80 + "\n")
-                
-            logging.info(f"Results saved to TXT: {filename}")
-            return filename
-            
-        except Exception as e:
-            logging.error(f"Error saving TXT: {e}")
-            raise
-            
-    def _save_html(self, results: Dict[str, Any], base_filename: str) -> str:
-        """Save results as interactive HTML report"""
-        filename = f"{base_filename}.html"
-        
-        try:
-            html_content = self._generate_html_report(results)
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-                
-            logging.info(f"Results saved to HTML: {filename}")
-            return filename
-            
-        except Exception as e:
-            logging.error(f"Error saving HTML: {e}")
-            raise
-            
-    def _save_xlsx(self, results: Dict[str, Any], base_filename: str) -> str:
-        """Save results as Excel file"""
-        filename = f"{base_filename}.xlsx"
-        
-        try:
-            # Prepare data for Excel
-            flattened_data = self._flatten_results_for_tabular(results)
-            
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                # Summary sheet
-                summary_data = results.get('summary', {})
-                summary_df = pd.DataFrame([summary_data]) if summary_data else pd.DataFrame()
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
-                
-                # Detailed results sheet
-                if flattened_data:
-                    df = pd.DataFrame(flattened_data)
-                    df.to_excel(writer, sheet_name='Detailed Results', index=False)
-                    
-                # Platform breakdown
-                platform_summary = []
-                for platform_type, platform_results in results.get('results', {}).items():
-                    hits = sum(1 for r in platform_results if r.get('status') == 'found')
-                    potential = sum(1 for r in platform_results if r.get('status') == 'potential_match')
-                    errors = sum(1 for r in platform_results if r.get('status') == 'error')
-                    total = len(platform_results)
-                    
-                    platform_summary.append({
-                        'Platform Type': platform_type,
-                        'Total Searched': total,
-                        'Hits': hits,
-                        'Potential Matches': potential,
-                        'Errors': errors,
-                        'Success Rate': f"{(hits/total*100):.1f}%" if total > 0 else "0%"
-                    })
-                    
-                if platform_summary:
-                    platform_df = pd.DataFrame(platform_summary)
-                    platform_df.to_excel(writer, sheet_name='Platform Breakdown', index=False)
-                    
-            logging.info(f"Results saved to Excel: {filename}")
-            return filename
-            
-        except Exception as e:
-            logging.error(f"Error saving Excel: {e}")
-            raise
-            
-    def _flatten_results_for_tabular(self, results: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Flatten nested results structure for tabular formats"""
-        flattened = []
-        
-        email = results.get('email', '')
-        timestamp = results.get('timestamp', '')
-        
         for platform_type, platform_results in results.get('results', {}).items():
+            stats = {'total': 0, 'hits': 0, 'potential': 0, 'errors': 0}
             for result in platform_results:
-                base_row = {
-                    'email': email,
-                    'timestamp': timestamp,
-                    'platform_type': platform_type,
-                    'platform': result.get('platform', ''),
-                    'url': result.get('url', ''),
-                    'status': result.get('status', ''),
-                    'search_method': result.get('search_method', ''),
-                    'search_time': result.get('search_time', ''),
-                    'error': result.get('error', ''),
-                    'match_count': len(result.get('matches', []))
-                }
-                
-                # If no matches, add the base row
-                matches = result.get('matches', [])
-                if not matches:
-                    flattened.append(base_row)
-                else:
-                    # Add one row per match
-                    for i, match in enumerate(matches):
-                        row = base_row.copy()
-                        row.update({
-                            'match_index': i + 1,
-                            'match_title': match.get('title', ''),
-                            'match_url': match.get('url', ''),
-                            'match_snippet': match.get('snippet', match.get('content', '')),
-                            'match_confidence': match.get('confidence', 0),
-                            'match_source': match.get('source', ''),
-                        })
-                        flattened.append(row)
-                        
-        return flattened
-        
-    def _generate_html_report(self, results: Dict[str, Any]) -> str:
-        """Generate interactive HTML report"""
-        email = results.get('email', 'Unknown')
-        timestamp = results.get('timestamp', 'Unknown')
-        summary = results.get('summary', {})
-        
-        html_template = f"""
-<!DOCTYPE html>
+                stats['total'] += 1
+                status = result.get('status', '')
+                if status == 'found':
+                    stats['hits'] += 1
+                elif status == 'potential_match':
+                    stats['potential'] += 1
+                elif status == 'error':
+                    stats['errors'] += 1
+
+                for match in result.get('matches', []):
+                    self.matches.append({
+                        'platform_name': result.get('platform', ''),
+                        'platform_type': platform_type,
+                        'platform_url': result.get('url', ''),
+                        'status': status,
+                        'match_data': match
+                    })
+
+            self.platform_stats[platform_type] = stats
+
+
+# Small LRU of (results, view) pairs keyed on the results dict's id. The
+# entry holds a strong reference to both, so the view survives between
+# calls and the dict's address cannot be recycled while its key is live;
+# the identity check below guards the entry against an explicit clear
+# racing a reuse.
+_VIEW_CACHE: "OrderedDict[int, tuple]" = OrderedDict()
+_VIEW_CACHE_MAX = 8
+
+
+def _view(results: Dict[str, Any]) -> _NormalizedResult:
+    """Get (or build and cache) the normalized view for a results dict"""
+    key = id(results)
+    entry = _VIEW_CACHE.get(key)
+    if entry is not None and entry[0] is results:
+        _VIEW_CACHE.move_to_end(key)
+        return entry[1]
+
+    view = _NormalizedResult(results)
+    _VIEW_CACHE[key] = (results, view)
+    while len(_VIEW_CACHE) > _VIEW_CACHE_MAX:
+        _VIEW_CACHE.popitem(last=False)
+    return view
+
+
+def _dumps_compact(obj: Any, limit: int = 32_000) -> str:
+    """Serialize a nested value to compact JSON, truncated to limit bytes.
+
+    The limit keeps worst-case row cost bounded and stays under the Excel
+    cell size cap when huge scraped 'details' blobs end up in tabular output.
+    """
+    if orjson is None:
+        data = json.dumps(obj, separators=(',', ':'), default=str).encode('utf-8')
+    else:
+        data = orjson.dumps(obj, default=str)
+    if len(data) > limit:
+        return (data[:limit] + b'..."[truncated]"').decode('utf-8', 'ignore')
+    return data.decode('utf-8')
+
+
+# Control characters illegal in XML 1.0; one C-level translate per string
+# beats re-serializing (and failing) on a poisoned snippet
+_XML_TRANS = str.maketrans(dict.fromkeys(
+    list(range(0x00, 0x09)) + [0x0B, 0x0C] + list(range(0x0E, 0x20)), None
+))
+
+
+def _xml_text(value: Any) -> str:
+    """Coerce a value to XML-safe text, stripping invalid control chars"""
+    if isinstance(value, str):
+        return value.translate(_XML_TRANS)
+    return str(value)
+
+
+_PLATFORM_ICONS = {
+    'marketplaces': '🛒',
+    'discussions': '💬',
+    'google': '🌐'
+}
+
+# Status -> report line prefix, one hash lookup instead of an if/elif chain
+_STATUS_PREFIX = {
+    'found': '✓ FOUND',
+    'potential_match': '? POTENTIAL',
+    'not_found': '✗ NOT FOUND',
+    'error': '! ERROR'
+}
+
+# Status -> (css class, display text); the set is closed, so compute once
+_STATUS_HTML = {
+    k: (k.replace('_', '-'), k.replace('_', ' ').title())
+    for k in ('found', 'potential_match', 'not_found', 'error', 'unknown')
+}
+
+_HTML_PRELUDE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Email OSINT Report - {email}</title>
-    <style>
-        body {{
+    <title>Email OSINT Results - {{ email }}</title>
+"""
+
+# Static CSS block, kept out of the per-call format path
+_HTML_CSS = """    <style>
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             margin: 0;
             padding: 20px;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             border-radius: 10px;
             box-shadow: 0 10px 30px rgba(0,0,0,0.3);
             overflow: hidden;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #2c3e50, #34495e);
             color: white;
             padding: 30px;
             text-align: center;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             margin: 0;
             font-size: 2.5em;
             font-weight: 300;
-        }}
-        .header p {{
+        }
+        .header p {
             margin: 10px 0 0 0;
             opacity: 0.8;
-        }}
-        .summary {{
+        }
+        .summary-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             padding: 30px;
             background: #f8f9fa;
-        }}
-        .stat-card {{
+        }
+        .summary-card {
             background: white;
             padding: 20px;
             border-radius: 8px;
             text-align: center;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
             transition: transform 0.2s;
-        }}
-        .stat-card:hover {{
+        }
+        .summary-card:hover {
             transform: translateY(-5px);
-        }}
-        .stat-number {{
+        }
+        .summary-number {
             font-size: 2.5em;
             font-weight: bold;
             color: #2c3e50;
             margin-bottom: 10px;
-        }}
-        .stat-label {{
+        }
+        .summary-label {
             color: #7f8c8d;
             font-size: 0.9em;
             text-transform: uppercase;
             letter-spacing: 1px;
-        }}
-        .results-container {{
+        }
+        .results-container {
             padding: 30px;
-        }}
-        .platform-section {{
+        }
+        .platform-section {
             margin-bottom: 40px;
-        }}
-        .platform-title {{
+        }
+        .platform-title {
             font-size: 1.8em;
             color: #2c3e50;
             margin-bottom: 20px;
@@ -436,113 +228,113 @@ class OutputFormatter:
             border-bottom: 3px solid #3498db;
             display: flex;
             align-items: center;
-        }}
-        .platform-icon {{
+        }
+        .platform-icon {
             margin-right: 10px;
             font-size: 1.2em;
-        }}
-        .result-grid {{
+        }
+        .result-grid {
             display: grid;
             gap: 20px;
-        }}
-        .result-card {{
+        }
+        .result-card {
             background: white;
             border: 1px solid #e0e0e0;
             border-radius: 8px;
             padding: 20px;
             transition: all 0.3s;
-        }}
-        .result-card:hover {{
+        }
+        .result-card:hover {
             box-shadow: 0 5px 20px rgba(0,0,0,0.1);
             border-color: #3498db;
-        }}
-        .result-card.found {{
+        }
+        .result-card.found {
             border-left: 4px solid #27ae60;
-        }}
-        .result-card.potential {{
+        }
+        .result-card.potential-match {
             border-left: 4px solid #f39c12;
-        }}
-        .result-card.not-found {{
+        }
+        .result-card.not-found {
             border-left: 4px solid #95a5a6;
-        }}
-        .result-card.error {{
+        }
+        .result-card.error {
             border-left: 4px solid #e74c3c;
-        }}
-        .result-header {{
+        }
+        .result-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 15px;
-        }}
-        .platform-name {{
+        }
+        .platform-name {
             font-size: 1.2em;
             font-weight: bold;
             color: #2c3e50;
-        }}
-        .status-badge {{
+        }
+        .status-badge {
             padding: 5px 15px;
             border-radius: 20px;
             font-size: 0.8em;
             font-weight: bold;
             text-transform: uppercase;
-        }}
-        .status-found {{
+        }
+        .status-found {
             background: #d5f4e6;
             color: #27ae60;
-        }}
-        .status-potential {{
+        }
+        .status-potential-match {
             background: #fef9e7;
             color: #f39c12;
-        }}
-        .status-not-found {{
+        }
+        .status-not-found {
             background: #f8f9fa;
             color: #95a5a6;
-        }}
-        .status-error {{
+        }
+        .status-error {
             background: #fdf2f2;
             color: #e74c3c;
-        }}
-        .matches {{
+        }
+        .matches {
             margin-top: 15px;
-        }}
-        .match-item {{
+        }
+        .match-item {
             background: #f8f9fa;
             border-radius: 5px;
             padding: 15px;
             margin-bottom: 10px;
-        }}
-        .match-title {{
+        }
+        .match-title {
             font-weight: bold;
             color: #2c3e50;
             margin-bottom: 8px;
-        }}
-        .match-snippet {{
+        }
+        .match-snippet {
             color: #7f8c8d;
             font-size: 0.9em;
             line-height: 1.4;
             margin-bottom: 8px;
-        }}
-        .match-url {{
+        }
+        .match-url {
             font-size: 0.8em;
             color: #3498db;
             word-break: break-all;
-        }}
-        .confidence {{
+        }
+        .confidence {
             float: right;
             font-size: 0.8em;
             background: #ecf0f1;
             padding: 2px 8px;
             border-radius: 10px;
             color: #2c3e50;
-        }}
-        .footer {{
+        }
+        .footer {
             background: #34495e;
             color: white;
             padding: 20px;
             text-align: center;
             font-size: 0.9em;
-        }}
-        .toggle-btn {{
+        }
+        .toggle-btn {
             background: #3498db;
             color: white;
             border: none;
@@ -551,138 +343,115 @@ class OutputFormatter:
             cursor: pointer;
             font-size: 0.8em;
             margin-left: 10px;
-        }}
-        .collapsible {{
+        }
+        .collapsible {
             display: block;
-        }}
-        .collapsed {{
+        }
+        .collapsed {
             display: none;
-        }}
-        @media (max-width: 768px) {{
-            .container {{
+        }
+        @media (max-width: 768px) {
+            .container {
                 margin: 10px;
-            }}
-            .header {{
+            }
+            .header {
                 padding: 20px;
-            }}
-            .header h1 {{
+            }
+            .header h1 {
                 font-size: 2em;
-            }}
-            .summary {{
+            }
+            .summary-grid {
                 grid-template-columns: 1fr 1fr;
                 padding: 20px;
-            }}
-            .results-container {{
+            }
+            .results-container {
                 padding: 20px;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
-<body>
+"""
+
+_HTML_BODY = """<body>
     <div class="container">
         <div class="header">
-            <h1>🔍 Email OSINT Report</h1>
-            <p>Target: <strong>{email}</strong> | Generated: {timestamp}</p>
+            <h1>🔍 Email OSINT Results</h1>
+            <p>Target: <strong>{{ email }}</strong> | Generated: {{ timestamp }}</p>
         </div>
-        
-        <div class="summary">
-            <div class="stat-card">
-                <div class="stat-number">{summary.get('total_platforms_searched', 0)}</div>
-                <div class="stat-label">Platforms Searched</div>
+
+        <div class="summary-grid">
+            <div class="summary-card">
+                <div class="summary-number">{{ summary.get('total_platforms_searched', 0) }}</div>
+                <div class="summary-label">Platforms Searched</div>
             </div>
-            <div class="stat-card">
-                <div class="stat-number">{summary.get('platforms_with_hits', 0)}</div>
-                <div class="stat-label">Hits Found</div>
+            <div class="summary-card">
+                <div class="summary-number">{{ summary.get('platforms_with_hits', 0) }}</div>
+                <div class="summary-label">Hits Found</div>
             </div>
-            <div class="stat-card">
-                <div class="stat-number">{summary.get('platforms_with_errors', 0)}</div>
-                <div class="stat-label">Errors</div>
+            <div class="summary-card">
+                <div class="summary-number">{{ summary.get('platforms_with_errors', 0) }}</div>
+                <div class="summary-label">Errors</div>
             </div>
-            <div class="stat-card">
-                <div class="stat-number">{summary.get('hit_rate_percentage', 0):.1f}%</div>
-                <div class="stat-label">Success Rate</div>
+            <div class="summary-card">
+                <div class="summary-number">{{ '%.1f'|format(summary.get('hit_rate_percentage', 0)) }}%</div>
+                <div class="summary-label">Success Rate</div>
             </div>
         </div>
-        
-        <div class="results-container">
-"""
 
-        # Add platform sections
-        for platform_type, platform_results in results.get('results', {}).items():
-            platform_icons = {
-                'marketplaces': '🛒',
-                'discussions': '💬',
-                'google': '🌐'
-            }
-            
-            icon = platform_icons.get(platform_type, '🔍')
-            html_template += f"""
+        <div class="results-container">
+{% for platform_type, platform_results in platforms.items() %}
             <div class="platform-section">
                 <div class="platform-title">
-                    <span class="platform-icon">{icon}</span>
-                    {platform_type.title()}
-                    <button class="toggle-btn" onclick="toggleSection('{platform_type}')">Toggle</button>
+                    <span class="platform-icon">{{ icons.get(platform_type, '🔍') }}</span>
+                    {{ platform_type.title() }}
+                    <button class="toggle-btn" onclick="toggleSection('{{ platform_type }}')">Toggle</button>
                 </div>
-                <div id="{platform_type}" class="result-grid collapsible">
-"""
-
-            for result in platform_results:
-                status = result.get('status', 'unknown')
-                status_class = status.replace('_', '-')
-                status_text = status.replace('_', ' ').title()
-                
-                html_template += f"""
-                    <div class="result-card {status_class}">
+                <div id="{{ platform_type }}" class="result-grid collapsible">
+{% for result in platform_results %}
+{% set status_class, status_text = status_map.get(result.get('status', 'unknown'), ('unknown', 'Unknown')) %}
+                    <div class="result-card {{ status_class }}">
                         <div class="result-header">
-                            <div class="platform-name">{result.get('platform', 'Unknown')}</div>
-                            <div class="status-badge status-{status_class}">{status_text}</div>
+                            <div class="platform-name">{{ result.get('platform', 'Unknown') }}</div>
+                            <div class="status-badge status-{{ status_class }}">{{ status_text }}</div>
                         </div>
-                        <div><strong>URL:</strong> {result.get('url', 'N/A')}</div>
-                        <div><strong>Method:</strong> {result.get('search_method', 'N/A')}</div>
-                        <div><strong>Time:</strong> {result.get('search_time', 'N/A')}</div>
-"""
-
-                # Add matches
-                matches = result.get('matches', [])
-                if matches:
-                    html_template += '<div class="matches"><strong>Matches:</strong>'
-                    for match in matches[:5]:  # Show first 5 matches
-                        confidence = match.get('confidence', 0)
-                        html_template += f"""
+                        <div><strong>URL:</strong> {{ result.get('url', 'N/A') }}</div>
+                        <div><strong>Method:</strong> {{ result.get('search_method', 'N/A') }}</div>
+                        <div><strong>Time:</strong> {{ result.get('search_time', 'N/A') }}</div>
+{% if result.get('matches') %}
+                        <div class="matches"><strong>Matches:</strong>
+{% for match in result['matches'][:5] %}
                         <div class="match-item">
                             <div class="match-title">
-                                {match.get('title', 'No title')}
-                                <span class="confidence">Confidence: {confidence:.2f}</span>
+                                {{ match.get('title', 'No title') }}
+                                <span class="confidence">Confidence: {{ '%.2f'|format(match.get('confidence', 0)) }}</span>
                             </div>
-"""
-                        if match.get('snippet') or match.get('content'):
-                            snippet = match.get('snippet', match.get('content', ''))[:200]
-                            html_template += f'<div class="match-snippet">{snippet}{"..." if len(snippet) == 200 else ""}</div>'
-                            
-                        if match.get('url'):
-                            html_template += f'<div class="match-url">{match["url"]}</div>'
-                            
-                        html_template += '</div>'
-                    html_template += '</div>'
-
-                # Add error if present
-                if result.get('error'):
-                    html_template += f'<div><strong>Error:</strong> {result["error"]}</div>'
-
-                html_template += '</div>'
-
-            html_template += '</div></div>'
-
-        # Close HTML
-        html_template += """
+{% set snippet = (match.get('snippet') or match.get('content') or '')[:200] %}
+{% if snippet %}
+                            <div class="match-snippet">{{ snippet }}{% if snippet|length == 200 %}...{% endif %}</div>
+{% endif %}
+{% if match.get('url') %}
+                            <a class="match-url" href="{{ match['url'] }}" target="_blank">{{ match['url'] }}</a>
+{% endif %}
+                        </div>
+{% endfor %}
+                        </div>
+{% endif %}
+{% if result.get('error') %}
+                        <div><strong>Error:</strong> {{ result['error'] }}</div>
+{% endif %}
+                    </div>
+{% endfor %}
+                </div>
+            </div>
+{% endfor %}
         </div>
-        
+
         <div class="footer">
             <p>Generated by Advanced Email OSINT Tool v1.0 (September 2025)</p>
             <p>For educational and legitimate security research purposes only</p>
         </div>
     </div>
-    
+
     <script>
         function toggleSection(sectionId) {
             const section = document.getElementById(sectionId);
@@ -694,7 +463,7 @@ class OutputFormatter:
                 section.classList.add('collapsed');
             }
         }
-        
+
         // Add click handlers for result cards
         document.querySelectorAll('.result-card').forEach(card => {
             card.addEventListener('click', function() {
@@ -709,4 +478,502 @@ class OutputFormatter:
 </html>
 """
 
-        return html_template
\ No newline at end of file
+# Compiled once at import; rendering runs Jinja's generated code with
+# autoescaping, replacing the hand-rolled fragment concatenation
+_HTML_TEMPLATE = Environment(
+    autoescape=select_autoescape(),
+    trim_blocks=True,
+    lstrip_blocks=True,
+).from_string(_HTML_PRELUDE + _HTML_CSS + _HTML_BODY)
+
+
+class OutputFormatter:
+    """Handles multiple output formats for search results"""
+
+    # Fixed column order shared by the CSV and Excel writers
+    _TABULAR_COLUMNS = (
+        'email', 'timestamp', 'platform_type', 'platform_name', 'url',
+        'status', 'search_method', 'search_time', 'error', 'match_count',
+        'details', 'first_match', 'match_index', 'match_title', 'match_url',
+        'match_snippet', 'match_confidence', 'match_source'
+    )
+
+    def __init__(self):
+        self.supported_formats = list(self._SAVERS)
+        # Directories already created this session; skips the stat that
+        # os.makedirs(exist_ok=True) still pays on every call
+        self._created_dirs = set()
+
+    def save_results(self, results: Dict[str, Any], filename: str, format_type: str = 'json') -> str:
+        """Save results in specified format"""
+        # O(1) dispatch instead of an if/elif chain over format names
+        saver = self._SAVERS.get(format_type)
+        if saver is None:
+            raise ValueError(f"Unsupported format: {format_type}. Supported: {self.supported_formats}")
+
+        # Ensure filename doesn't have extension
+        base_filename = filename.rsplit('.', 1)[0]
+
+        # Bare filenames default into results/ — previously the directory was
+        # created but the file still landed in the working directory
+        results_dir = os.path.dirname(base_filename)
+        if not results_dir:
+            results_dir = 'results'
+            base_filename = os.path.join(results_dir, base_filename)
+
+        if results_dir not in self._created_dirs:
+            os.makedirs(results_dir, exist_ok=True)
+            self._created_dirs.add(results_dir)
+
+        # Warm the normalized view once; saving the same results object in
+        # several formats then reuses the cached per-platform aggregates
+        _view(results)
+
+        return saver(self, results, base_filename)
+
+
+    def _save_json(self, results: Dict[str, Any], base_filename: str) -> str:
+        """Save results as JSON"""
+        filename = f"{base_filename}.json"
+        
+        try:
+            if orjson is not None:
+                # C encoder, emits UTF-8 bytes directly in one shot
+                data = orjson.dumps(
+                    results,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+                with open(filename, 'wb') as f:
+                    f.write(data)
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+
+            logging.info(f"Results saved to JSON: {filename}")
+            return filename
+            
+        except Exception as e:
+            logging.error(f"Error saving JSON: {e}")
+            raise
+            
+    def _save_csv(self, results: Dict[str, Any], base_filename: str) -> str:
+        """Save results as CSV"""
+        filename = f"{base_filename}.csv"
+        
+        try:
+            # Flatten results into column arrays once
+            columns = self._flatten_results_for_tabular(results, as_columns=True)
+
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                if columns['email']:
+                    # zip(*columns) streams tuples straight into the C csv
+                    # writer, no per-row dict or DataFrame construction
+                    writer.writerow(columns.keys())
+                    writer.writerows(zip(*columns.values()))
+                else:
+                    # Empty results
+                    writer.writerow(['email', 'timestamp', 'status', 'message'])
+                    writer.writerow([
+                        results.get('email', ''),
+                        results.get('timestamp', ''),
+                        'no_results',
+                        'No matches found'
+                    ])
+
+
+            logging.info(f"Results saved to CSV: {filename}")
+            return filename
+            
+        except Exception as e:
+            logging.error(f"Error saving CSV: {e}")
+            raise
+            
+    def _save_xml(self, results: Dict[str, Any], base_filename: str) -> str:
+        """Save results as XML"""
+        filename = f"{base_filename}.xml"
+
+        try:
+            if _HAVE_LXML:
+                # Incremental writer: O(one element) memory, no full DOM
+                self._write_xml_stream(results, filename)
+            else:
+                self._write_xml_tree(results, filename)
+
+            logging.info(f"Results saved to XML: {filename}")
+            return filename
+
+        except Exception as e:
+            logging.error(f"Error saving XML: {e}")
+            raise
+
+    def _write_xml_stream(self, results: Dict[str, Any], filename: str) -> None:
+        """Stream the XML document to disk with lxml's incremental writer"""
+        def leaf(tag: str, value: Any) -> Any:
+            elem = ET.Element(tag)
+            elem.text = _xml_text(value)
+            return elem
+
+        with ET.xmlfile(filename, encoding='utf-8') as xf:
+            xf.write_declaration()
+            with xf.element('osint_results'):
+                with xf.element('metadata'):
+                    xf.write(leaf('email', results.get('email', '')))
+                    xf.write(leaf('timestamp', results.get('timestamp', '')))
+                    xf.write(leaf('tool_version', '1.0'))
+
+                with xf.element('summary'):
+                    for key, value in results.get('summary', {}).items():
+                        xf.write(leaf(key, value))
+
+                with xf.element('search_results'):
+                    for platform_type, platform_results in _view(results).platform_results.items():
+                        with xf.element('platform_type', name=platform_type):
+                            for result in platform_results:
+                                with xf.element('result'):
+                                    xf.write(leaf('platform', result.get('platform', '')))
+                                    xf.write(leaf('url', result.get('url', '')))
+                                    xf.write(leaf('status', result.get('status', '')))
+                                    xf.write(leaf('search_method', result.get('search_method', '')))
+                                    xf.write(leaf('search_time', result.get('search_time', '')))
+
+                                    with xf.element('matches'):
+                                        for match in result.get('matches', []):
+                                            with xf.element('match'):
+                                                for key, value in match.items():
+                                                    xf.write(leaf(key, value))
+
+                                    if result.get('error'):
+                                        xf.write(leaf('error', result.get('error', '')))
+
+    def _write_xml_tree(self, results: Dict[str, Any], filename: str) -> None:
+        """Build the full element tree in memory (stdlib fallback path)"""
+        root = ET.Element('osint_results')
+        
+        # Add metadata
+        metadata = ET.SubElement(root, 'metadata')
+        ET.SubElement(metadata, 'email').text = results.get('email', '')
+        ET.SubElement(metadata, 'timestamp').text = results.get('timestamp', '')
+        ET.SubElement(metadata, 'tool_version').text = '1.0'
+        
+        # Add summary
+        summary_data = results.get('summary', {})
+        summary_elem = ET.SubElement(root, 'summary')
+        for key, value in summary_data.items():
+            ET.SubElement(summary_elem, key).text = _xml_text(value)
+            
+        # Add results
+        results_elem = ET.SubElement(root, 'search_results')
+        
+        for platform_type, platform_results in _view(results).platform_results.items():
+            platform_elem = ET.SubElement(results_elem, 'platform_type', name=platform_type)
+            
+            for result in platform_results:
+                result_elem = ET.SubElement(platform_elem, 'result')
+                
+                # Add basic result info
+                ET.SubElement(result_elem, 'platform').text = _xml_text(result.get('platform', ''))
+                ET.SubElement(result_elem, 'url').text = _xml_text(result.get('url', ''))
+                ET.SubElement(result_elem, 'status').text = _xml_text(result.get('status', ''))
+                ET.SubElement(result_elem, 'search_method').text = _xml_text(result.get('search_method', ''))
+                ET.SubElement(result_elem, 'search_time').text = _xml_text(result.get('search_time', ''))
+                
+                # Add matches
+                matches_elem = ET.SubElement(result_elem, 'matches')
+                for match in result.get('matches', []):
+                    match_elem = ET.SubElement(matches_elem, 'match')
+                    for key, value in match.items():
+                        ET.SubElement(match_elem, key).text = _xml_text(value)
+                        
+                # Add error if present
+                if result.get('error'):
+                    ET.SubElement(result_elem, 'error').text = _xml_text(result.get('error', ''))
+                    
+        # Write pretty-printed XML directly, no minidom re-parse round trip
+        ET.indent(root, space='  ')
+        ET.ElementTree(root).write(filename, encoding='utf-8', xml_declaration=True)
+
+    def _save_txt(self, results: Dict[str, Any], base_filename: str) -> str:
+        """Save results as plain text report"""
+        filename = f"{base_filename}.txt"
+        
+        try:
+            # Header and summary
+            summary = results.get('summary', {})
+            parts = [
+                "="*80 + "\n"
+                "EMAIL OSINT SEARCH RESULTS\n"
+                + "="*80 + "\n\n"
+                f"Target Email: {results.get('email', 'Unknown')}\n"
+                f"Search Date: {results.get('timestamp', 'Unknown')}\n"
+                "Tool Version: 1.0 (September 2025)\n\n"
+                "SEARCH SUMMARY\n"
+                + "-" * 40 + "\n"
+                f"Total Platforms Searched: {summary.get('total_platforms_searched', 0)}\n"
+                f"Platforms with Hits: {summary.get('platforms_with_hits', 0)}\n"
+                f"Platforms with Errors: {summary.get('platforms_with_errors', 0)}\n"
+                f"Success Rate: {summary.get('hit_rate_percentage', 0):.2f}%\n\n"
+                "DETAILED FINDINGS\n"
+                + "-" * 40 + "\n\n"
+            ]
+
+            for platform_type, platform_results in _view(results).platform_results.items():
+                pt_upper = platform_type.upper()
+                parts.append(f"[{pt_upper}]\n" + "="*60 + "\n")
+
+                for result in platform_results:
+                    # Hoist field access; one lookup per field per result
+                    status = result.get('status', 'unknown')
+                    platform_name = result.get('platform', 'Unknown')
+                    url = result.get('url', 'N/A')
+                    method = result.get('search_method', 'N/A')
+                    search_time = result.get('search_time', 'N/A')
+                    error = result.get('error')
+                    matches = result.get('matches', [])
+
+                    prefix = _STATUS_PREFIX.get(status, '- UNKNOWN')
+                    parts.append(
+                        f"{prefix}: {platform_name}\n"
+                        f"  URL: {url}\n"
+                        f"  Method: {method}\n"
+                        f"  Time: {search_time}\n"
+                    )
+
+                    # Show matches
+                    if matches:
+                        parts.append(f"  Matches: {len(matches)}\n")
+                        for i, match in enumerate(matches[:3], 1):  # Show first 3 matches
+                            parts.append(f"    [{i}] {match.get('title', 'No title')}\n")
+                            snippet = match.get('snippet', match.get('content', ''))
+                            if snippet:
+                                parts.append(f"        {snippet[:100]}{'...' if len(snippet) > 100 else ''}\n")
+                            if match.get('url'):
+                                parts.append(f"        URL: {match['url']}\n")
+                            parts.append(f"        Confidence: {match.get('confidence', 0):.2f}\n")
+
+                    # Show errors
+                    if error:
+                        parts.append(f"  Error: {error}\n")
+
+                    parts.append("\n")
+
+                parts.append("\n")
+
+            # Footer
+            parts.append(
+                "="*80 + "\n"
+                "Report generated by Advanced Email OSINT Tool v1.0\n"
+                "For educational and legitimate security research only\n"
+                + "="*80 + "\n"
+            )
+
+            # Single bulk write; per-record writes each cost a Python->C hop
+            with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(''.join(parts))
+
+            logging.info(f"Results saved to TXT: {filename}")
+            return filename
+            
+        except Exception as e:
+            logging.error(f"Error saving TXT: {e}")
+            raise
+            
+    def _save_html(self, results: Dict[str, Any], base_filename: str) -> str:
+        """Save results as interactive HTML report"""
+        filename = f"{base_filename}.html"
+        
+        try:
+            # Stream fragments straight to the buffered handle; peak memory
+            # stays at one fragment instead of the whole document
+            with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                self._generate_html_report(results, f)
+                
+            logging.info(f"Results saved to HTML: {filename}")
+            return filename
+            
+        except Exception as e:
+            logging.error(f"Error saving HTML: {e}")
+            raise
+            
+    def _save_xlsx(self, results: Dict[str, Any], base_filename: str) -> str:
+        """Save results as Excel file"""
+        filename = f"{base_filename}.xlsx"
+        
+        try:
+            # Prepare data for Excel as column arrays
+            columns = self._flatten_results_for_tabular(results, as_columns=True)
+
+            with pd.ExcelWriter(filename, engine='xlsxwriter',
+                                engine_kwargs={'options': {'constant_memory': True}}) as writer:
+                # Summary sheet
+                summary_data = results.get('summary', {})
+                summary_df = pd.DataFrame([summary_data]) if summary_data else pd.DataFrame()
+                summary_df.to_excel(writer, sheet_name='Summary', index=False)
+
+                # Detailed results sheet
+                if columns['email']:
+                    df = pd.DataFrame(columns)
+                    df.to_excel(writer, sheet_name='Detailed Results', index=False)
+                    
+                # Platform breakdown (aggregates come from the cached view)
+                platform_summary = []
+                for platform_type, stats in _view(results).platform_stats.items():
+                    hits = stats['hits']
+                    total = stats['total']
+
+                    platform_summary.append({
+                        'Platform Type': platform_type,
+                        'Total Searched': total,
+                        'Hits': hits,
+                        'Potential Matches': stats['potential'],
+                        'Errors': stats['errors'],
+                        'Success Rate': f"{(hits/total*100):.1f}%" if total > 0 else "0%"
+                    })
+                    
+                if platform_summary:
+                    platform_df = pd.DataFrame(platform_summary)
+                    platform_df.to_excel(writer, sheet_name='Platform Breakdown', index=False)
+                    
+            logging.info(f"Results saved to Excel: {filename}")
+            return filename
+            
+        except Exception as e:
+            logging.error(f"Error saving Excel: {e}")
+            raise
+            
+    def create_summary_report(self, results: Dict[str, Any]) -> str:
+        """Create a short plain-text summary report"""
+        view = _view(results)
+        summary = view.summary
+
+        lines = [
+            "=" * 80,
+            "EMAIL OSINT SUMMARY REPORT",
+            "=" * 80,
+            "",
+            f"Target Email: {view.email}",
+            f"Search Date: {view.timestamp}",
+            "",
+            f"Total Platforms Searched: {summary.get('total_platforms_searched', 0)}",
+            f"Platforms with Hits: {summary.get('platforms_with_hits', 0)}",
+            f"Platforms with Errors: {summary.get('platforms_with_errors', 0)}",
+            f"Success Rate: {summary.get('hit_rate_percentage', 0):.2f}%",
+            "",
+            "PLATFORM BREAKDOWN",
+            "-" * 40,
+        ]
+
+        for platform_type, stats in view.platform_stats.items():
+            lines.append(
+                f"{platform_type.title()}: {stats['hits']}/{stats['total']} platforms with hits"
+            )
+
+        lines.append("")
+        lines.append("=" * 80)
+        return "\n".join(lines)
+
+    def export_matches_only(self, results: Dict[str, Any], filename: str) -> str:
+        """Export only the matches (one entry per match) as JSON"""
+        if not filename.endswith('.json'):
+            filename = f"{filename}.json"
+
+        view = _view(results)
+        export_data = {
+            'email': view.email,
+            'timestamp': view.timestamp,
+            'export_time': datetime.now().isoformat(),
+            'total_matches': len(view.matches),
+            'matches': view.matches
+        }
+
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
+
+            logging.info(f"Matches exported to: {filename}")
+            return filename
+
+        except Exception as e:
+            logging.error(f"Error exporting matches: {e}")
+            raise
+
+    def _flatten_results_for_tabular(self, results: Dict[str, Any],
+                                     as_columns: bool = False) -> Any:
+        """Flatten nested results structure for tabular formats.
+
+        Builds rows as tuples in _TABULAR_COLUMNS order and transposes once,
+        so no per-row dict copy/update happens. With as_columns=True the
+        column arrays (dict of lists) are returned directly, ready for
+        pd.DataFrame without the row-to-column transpose pandas would
+        otherwise do internally.
+        """
+        email = results.get('email', '')
+        timestamp = results.get('timestamp', '')
+        rows = []
+
+        for platform_type, platform_results in _view(results).platform_results.items():
+            for result in platform_results:
+                matches = result.get('matches', [])
+                base = (
+                    email,
+                    timestamp,
+                    platform_type,
+                    result.get('platform', ''),
+                    result.get('url', ''),
+                    result.get('status', ''),
+                    result.get('search_method', ''),
+                    result.get('search_time', ''),
+                    result.get('error', ''),
+                    len(matches),
+                    _dumps_compact(result.get('details', {})),
+                    _dumps_compact(matches[0]) if matches else ''
+                )
+
+                if not matches:
+                    rows.append(base + ('', '', '', '', 0, ''))
+                else:
+                    # One row per match
+                    for i, match in enumerate(matches):
+                        # Clamp once here; unbounded forum-post scrapes would
+                        # otherwise be copied in full into every tabular cell
+                        snippet = (match.get('snippet')
+                                   or match.get('content') or '')[:1024]
+                        rows.append(base + (
+                            i + 1,
+                            match.get('title', ''),
+                            match.get('url', ''),
+                            snippet,
+                            match.get('confidence', 0),
+                            match.get('source', ''),
+                        ))
+
+        if as_columns:
+            if not rows:
+                return {name: [] for name in self._TABULAR_COLUMNS}
+            return dict(zip(self._TABULAR_COLUMNS, map(list, zip(*rows))))
+
+        return [dict(zip(self._TABULAR_COLUMNS, row)) for row in rows]
+        
+    def _generate_html_report(self, results: Dict[str, Any], out: Any) -> None:
+        """Stream the interactive HTML report to a writable text file"""
+        # Jinja's compiled generator handles escaping and fragment joining;
+        # stream().dump() keeps the peak memory of the streaming writer
+        _HTML_TEMPLATE.stream(
+            email=results.get('email', 'Unknown'),
+            timestamp=results.get('timestamp', 'Unknown'),
+            summary=results.get('summary', {}),
+            platforms=_view(results).platform_results,
+            status_map=_STATUS_HTML,
+            icons=_PLATFORM_ICONS,
+        ).dump(out)
+
+    # Format name -> unbound saver; placed after the methods it references
+    _SAVERS = {
+        'json': _save_json,
+        'csv': _save_csv,
+        'xml': _save_xml,
+        'txt': _save_txt,
+        'html': _save_html,
+        'xlsx': _save_xlsx,
+    }
@@ -6,28 +6,104 @@ Date: September 2025
 """
 
 import random
+import re
+import itertools
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import logging
 import time
 import threading
+import asyncio
 from typing import List, Dict, Optional, Any
 import os
+from pathlib import Path
 from urllib.parse import urlparse
 import socket
 import concurrent.futures
 from datetime import datetime, timedelta
+from types import MappingProxyType
+from functools import lru_cache
+from bisect import bisect_left
+from array import array
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+
+# Accepts either a full proxy URL or a bare host:port (optionally with
+# user:pass@); one C-level match per line replaces urlparse plus string scans
+_PROXY_RE = re.compile(
+    r'^(?:'
+    r'(?:https?|socks[45])://\S+'
+    r'|(?:\S+@)?[^:/@\s]+:(\d{1,5})'
+    r')$'
+)
+
+
+@lru_cache(maxsize=4096)
+def _build_proxy_urls(line: str, proxy_auth: Optional[str]) -> Optional[tuple]:
+    """Resolve a proxy line to its (http, https) URL pair, cached per line.
+
+    The string splitting and URL formatting only depend on the line and the
+    auth credentials, so repeated parses of the same proxy are one hash
+    lookup instead of fresh string work.
+    """
+    match = _PROXY_RE.match(line)
+    if match is None:
+        return None
+
+    port = match.group(1)
+    if port is not None and not 0 < int(port) <= 65535:
+        return None
+
+    if '://' in line:
+        # Full URL format
+        return (line, line)
+
+    # IP:PORT format, assume HTTP
+    host, port = line.split(':', 1)
+    if proxy_auth:
+        proxy_url = f"http://{proxy_auth}@{host}:{port}"
+    else:
+        proxy_url = f"http://{host}:{port}"
+    return (proxy_url, proxy_url)
 
 
 class ProxyManager:
     """Manages proxy rotation and validation"""
+
+    # Lightweight reachability endpoint: 204, no response body
+    TEST_URL = 'http://httpbin.org/status/204'
     
-    def __init__(self, proxy_file: str = "proxies.txt", max_retries: int = 3):
+    def __init__(self, proxy_file: str = "proxies.txt", max_retries: int = 3,
+                 verdict_ttl: int = 300):
         self.proxy_file = proxy_file
         self.max_retries = max_retries
+        self.verdict_ttl = verdict_ttl
         self.proxies = []
         self.working_proxies = []
         self.failed_proxies = []
+        # Key sets mirroring the lists above (keyed by the original proxy
+        # string) so membership checks under the lock are O(1), not O(N)
+        self._proxy_keys = set()
+        self._working_keys = set()
+        self._failed_keys = set()
+        # Immutable snapshots swapped on mutation; get_proxy reads them
+        # without taking the lock
+        self._working_snapshot = ()
+        self._all_snapshot = ()
+        # Cumulative-weight table for weighted best-proxy sampling,
+        # rebuilt at write time once enough results have accumulated.
+        # Published as one (refs, cum_weights, total) tuple swapped in a
+        # single assignment so lock-free readers never mix generations
+        self._weight_table = ((), array('d'), 0.0)
+        self._weight_changes = 0
         self.current_index = 0
+        self._counter = itertools.count()
         self.lock = threading.Lock()
         
         # Load proxy authentication from environment
@@ -35,6 +111,19 @@ class ProxyManager:
         
         # Performance tracking
         self.proxy_performance = {}
+
+        # Pooled sessions for validation, keyed by proxy URL; reusing the
+        # TCP/TLS connections to the fixed test endpoints skips handshakes
+        self._test_session_cache: Dict[str, requests.Session] = {}
+
+        # Recent validation verdicts: proxy URL -> (is_working, rt, when).
+        # Re-validating inside the TTL is answered from here with no HTTP
+        self._verdict_cache: Dict[str, tuple] = {}
+
+        # Validations currently in flight, keyed by proxy URL; concurrent
+        # callers for the same proxy share one result instead of racing
+        # duplicate HTTP checks
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
         
         # Load proxies on initialization
         self.load_proxies()
@@ -42,29 +131,39 @@ class ProxyManager:
     def load_proxies(self):
         """Load proxy list from file"""
         if not os.path.exists(self.proxy_file):
-            logging.warning(f"Proxy file {self.proxy_file} not found. Creating default file.")
+            logger.warning("Proxy file %s not found. Creating default file.", self.proxy_file)
             self._create_default_proxy_file()
             return
             
         try:
-            with open(self.proxy_file, 'r') as f:
-                lines = f.readlines()
-                
-            for line in lines:
+            # One bulk read + C-level splitlines instead of a readline loop
+            raw = Path(self.proxy_file).read_text(encoding='utf-8', errors='ignore')
+
+            invalid_count = 0
+            for line in raw.splitlines():
                 line = line.strip()
-                if line and not line.startswith('#'):
-                    proxy = self._parse_proxy_line(line)
-                    if proxy:
-                        self.proxies.append(proxy)
-                        
-            logging.info(f"Loaded {len(self.proxies)} proxies from {self.proxy_file}")
+                if not line or line.startswith('#'):
+                    continue
+
+                proxy = self._parse_proxy_line(line)
+                if proxy is None:
+                    # Count invalid lines; logging each would dominate load time
+                    invalid_count += 1
+                elif proxy['original'] not in self._proxy_keys:
+                    self.proxies.append(proxy)
+                    self._proxy_keys.add(proxy['original'])
+
+            self._refresh_snapshots()
+            if invalid_count:
+                logger.debug("Skipped %d invalid proxy lines", invalid_count)
+            logger.info("Loaded %d proxies from %s", len(self.proxies), self.proxy_file)
             
             # Validate proxies on startup if enabled
             if os.getenv('PROXY_VALIDATION_ON_STARTUP', 'false').lower() == 'true':
                 self.validate_all_proxies()
                 
         except Exception as e:
-            logging.error(f"Error loading proxy file: {e}")
+            logger.error("Error loading proxy file: %s", e)
             
     def _create_default_proxy_file(self):
         """Create default proxy file with examples"""
@@ -83,69 +182,76 @@ class ProxyManager:
         try:
             with open(self.proxy_file, 'w') as f:
                 f.write(default_content)
-            logging.info(f"Created default proxy file: {self.proxy_file}")
+            logger.info("Created default proxy file: %s", self.proxy_file)
         except Exception as e:
-            logging.error(f"Failed to create default proxy file: {e}")
+            logger.error("Failed to create default proxy file: %s", e)
             
     def _parse_proxy_line(self, line: str) -> Optional[Dict[str, str]]:
         """Parse a proxy line into a dictionary"""
         try:
-            # Handle different proxy formats
-            if '://' in line:
-                # Full URL format
-                parsed = urlparse(line)
-                proxy_dict = {
-                    'http': line,
-                    'https': line
-                }
-            else:
-                # IP:PORT format, assume HTTP
-                if ':' in line:
-                    host, port = line.split(':', 1)
-                    if self.proxy_auth:
-                        proxy_url = f"http://{self.proxy_auth}@{host}:{port}"
-                    else:
-                        proxy_url = f"http://{host}:{port}"
-                    proxy_dict = {
-                        'http': proxy_url,
-                        'https': proxy_url
-                    }
-                else:
-                    return None
-                    
+            urls = _build_proxy_urls(line, self.proxy_auth)
+            if urls is None:
+                return None
+
+            # Fresh dict per proxy — requests mutates it and each carries
+            # its own metadata; only the URL formatting is cached
+            proxy_dict = {
+                'http': urls[0],
+                'https': urls[1]
+            }
+
+            # Read-only scheme->URL mapping handed to requests; frozen at
+            # parse time so the hot path never rebuilds it and never leaks
+            # the metadata keys below into the proxies= argument
+            proxy_dict['requests_dict'] = MappingProxyType({
+                'http': urls[0],
+                'https': urls[1]
+            })
+
+            # Host/port split once at parse time; the TCP probes read these
+            # instead of re-running urlparse on every validation
+            parsed = urlparse(urls[0])
+            proxy_dict['host'] = parsed.hostname
+            proxy_dict['port'] = parsed.port
+
             # Add metadata
             proxy_dict['original'] = line
             proxy_dict['last_used'] = None
             proxy_dict['failures'] = 0
             proxy_dict['successes'] = 0
             proxy_dict['avg_response_time'] = 0
+            proxy_dict['rt_sum'] = 0.0
+            proxy_dict['rt_count'] = 0
             
             return proxy_dict
             
         except Exception as e:
-            logging.debug(f"Error parsing proxy line '{line}': {e}")
+            logger.debug("Error parsing proxy line '%s': %s", line, e)
             return None
             
+    def _refresh_snapshots(self):
+        """Rebuild the immutable proxy snapshots after a mutation"""
+        self._working_snapshot = tuple(self.working_proxies)
+        self._all_snapshot = tuple(self.proxies)
+
     def get_proxy(self) -> Optional[Dict[str, str]]:
         """Get next available proxy with rotation"""
-        if not self.working_proxies and not self.proxies:
+        # Lock-free hot path: read the current snapshot and advance the
+        # shared counter (itertools.count is atomic under the GIL)
+        proxy_list = self._working_snapshot or self._all_snapshot
+
+        if not proxy_list:
             return None
-            
-        with self.lock:
-            # Use working proxies first
-            proxy_list = self.working_proxies if self.working_proxies else self.proxies
-            
-            if not proxy_list:
-                return None
-                
-            # Round-robin selection
-            proxy = proxy_list[self.current_index % len(proxy_list)]
-            self.current_index += 1
-            
-            # Update last used time
-            proxy['last_used'] = datetime.now()
-            
-            return proxy
+
+        index = next(self._counter)
+        self.current_index = index + 1
+
+        proxy = proxy_list[index % len(proxy_list)]
+
+        # Update last used time
+        proxy['last_used'] = datetime.now()
+
+        return proxy
             
     def get_proxy_string(self) -> Optional[str]:
         """Get proxy as string for use with Selenium"""
@@ -160,84 +266,308 @@ class ProxyManager:
         
     def mark_proxy_failed(self, proxy: Dict[str, str]):
         """Mark a proxy as failed"""
+        key = proxy.get('original', '')
+
         with self.lock:
             proxy['failures'] += 1
             
             # Remove from working proxies if too many failures
             if proxy['failures'] >= self.max_retries:
-                if proxy in self.working_proxies:
-                    self.working_proxies.remove(proxy)
-                if proxy not in self.failed_proxies:
+                if key in self._working_keys:
+                    self._working_keys.discard(key)
+                    self.working_proxies = [
+                        p for p in self.working_proxies if p.get('original') != key
+                    ]
+                if key not in self._failed_keys:
+                    self._failed_keys.add(key)
                     self.failed_proxies.append(proxy)
-                    
-                logging.warning(f"Proxy {proxy.get('original', 'unknown')} marked as failed")
+
+                self._refresh_snapshots()
+                logger.warning("Proxy %s marked as failed", key or 'unknown')
+
+            self._note_weight_change()
                 
     def mark_proxy_success(self, proxy: Dict[str, str], response_time: float = 0):
         """Mark a proxy as successful"""
         with self.lock:
             proxy['successes'] += 1
             
-            # Update average response time
+            # Update average response time as a true running mean; the old
+            # (avg + rt) / 2 recompute over-weighted the latest sample
             if response_time > 0:
-                if proxy['avg_response_time'] == 0:
-                    proxy['avg_response_time'] = response_time
-                else:
-                    proxy['avg_response_time'] = (proxy['avg_response_time'] + response_time) / 2
+                proxy['rt_sum'] = proxy.get('rt_sum', 0.0) + response_time
+                proxy['rt_count'] = proxy.get('rt_count', 0) + 1
+                proxy['avg_response_time'] = proxy['rt_sum'] / proxy['rt_count']
                     
             # Add to working proxies if not already there
-            if proxy not in self.working_proxies:
+            key = proxy.get('original', '')
+            if key not in self._working_keys:
+                self._working_keys.add(key)
                 self.working_proxies.append(proxy)
+                self._refresh_snapshots()
+
+            self._note_weight_change()
                 
+    def _get_test_session(self, proxy: Dict[str, str]) -> requests.Session:
+        """Get (or build) the pooled session used to validate a proxy"""
+        key = proxy.get('http', '')
+        session = self._test_session_cache.get(key)
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=32,
+                max_retries=Retry(total=0)
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            self._test_session_cache[key] = session
+
+        return session
+
+    def _check_verdict_cache(self, proxy: Dict[str, str]) -> Optional[bool]:
+        """Return a recent cached verdict for a proxy, or None if stale"""
+        hit = self._verdict_cache.get(proxy.get('http', ''))
+        if hit is not None and time.monotonic() - hit[2] < self.verdict_ttl:
+            return hit[0]
+        return None
+
+    def _store_verdict(self, proxy: Dict[str, str], is_working: bool,
+                       response_time: float):
+        """Record a validation verdict with its timestamp"""
+        self._verdict_cache[proxy.get('http', '')] = (
+            is_working, response_time, time.monotonic()
+        )
+
+    def _probe_proxy_socket(self, proxy: Dict[str, str], timeout: float = 2.0) -> bool:
+        """Cheap TCP reachability probe before paying for HTTP through a proxy.
+
+        A dead proxy costs a 2s connect timeout here instead of a full
+        HTTP timeout plus TLS attempt per test URL.
+        """
+        host = proxy.get('host')
+        port = proxy.get('port')
+        if host is None or port is None:
+            parsed = urlparse(proxy.get('http', ''))
+            host, port = parsed.hostname, parsed.port
+        if not host or not port:
+            # Can't probe; fall through to the HTTP test
+            return True
+
+        try:
+            with socket.create_connection((host, port), timeout=timeout):
+                return True
+        except OSError:
+            logger.debug("Proxy %s failed TCP probe", proxy.get('original', 'unknown'))
+            return False
+
     def validate_proxy(self, proxy: Dict[str, str], timeout: int = 10) -> bool:
         """Validate a single proxy"""
-        test_urls = [
-            'http://httpbin.org/ip',
-            'https://api.ipify.org?format=json',
-            'http://ip-api.com/json'
-        ]
+        cached = self._check_verdict_cache(proxy)
+        if cached is not None:
+            return cached
+
+        # Coalesce concurrent checks of the same proxy onto one request
+        key = proxy.get('http', '')
+        with self.lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+
+        if pending is not None:
+            return pending.result()
+
+        try:
+            result = self._validate_proxy_once(proxy, timeout)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.lock:
+                self._inflight.pop(key, None)
+
+    def _validate_proxy_once(self, proxy: Dict[str, str], timeout: int) -> bool:
+        """Run one validation round trip; validate_proxy dedupes callers"""
+        if not self._probe_proxy_socket(proxy):
+            self.mark_proxy_failed(proxy)
+            self._store_verdict(proxy, False, 0.0)
+            return False
+
+        session = self._get_test_session(proxy)
+
+        try:
+            start_time = time.time()
+
+            # Reachability only needs headers: HEAD to a 204 endpoint moves
+            # no body and parses no JSON
+            proxies = proxy.get('requests_dict', proxy)
+            response = session.head(
+                self.TEST_URL,
+                proxies=proxies,
+                timeout=timeout,
+                allow_redirects=False
+            )
+            if response.status_code == 405:
+                # Endpoint refuses HEAD; pay for the GET once
+                response = session.get(self.TEST_URL, proxies=proxies, timeout=timeout)
+
+            response_time = time.time() - start_time
+
+            if response.status_code in (200, 204):
+                self.mark_proxy_success(proxy, response_time)
+                self._store_verdict(proxy, True, response_time)
+                logger.info("Proxy %s validated successfully (%.2fs)", proxy.get('original', 'unknown'), response_time)
+                return True
+
+        except Exception as e:
+            logger.debug("Proxy validation failed for %s: %s", proxy.get('original', 'unknown'), e)
+
+        self.mark_proxy_failed(proxy)
+        self._store_verdict(proxy, False, 0.0)
+        return False
         
-        for url in test_urls:
+    async def _validate_proxy_async(self, session, proxy: Dict[str, str]) -> bool:
+        """Async counterpart of validate_proxy sharing one aiohttp session"""
+        cached = self._check_verdict_cache(proxy)
+        if cached is not None:
+            return cached
+
+        host = proxy.get('host')
+        port = proxy.get('port')
+        if host is None or port is None:
+            parsed = urlparse(proxy.get('http', ''))
+            host, port = parsed.hostname, parsed.port
+        if host and port:
             try:
-                start_time = time.time()
-                
-                response = requests.get(
-                    url,
-                    proxies=proxy,
-                    timeout=timeout,
-                    headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(host, port),
+                    timeout=2
                 )
-                
-                response_time = time.time() - start_time
-                
-                if response.status_code == 200:
+                writer.close()
+            except (OSError, asyncio.TimeoutError):
+                logger.debug("Proxy %s failed TCP probe", proxy.get('original', 'unknown'))
+                self.mark_proxy_failed(proxy)
+                self._store_verdict(proxy, False, 0.0)
+                return False
+
+        try:
+            start_time = time.time()
+
+            async with session.head(
+                self.TEST_URL,
+                proxy=proxy.get('http'),
+                allow_redirects=False
+            ) as response:
+                if response.status in (200, 204):
+                    response_time = time.time() - start_time
                     self.mark_proxy_success(proxy, response_time)
-                    logging.info(f"Proxy {proxy.get('original', 'unknown')} validated successfully ({response_time:.2f}s)")
+                    self._store_verdict(proxy, True, response_time)
+                    logger.info("Proxy %s validated successfully (%.2fs)", proxy.get('original', 'unknown'), response_time)
                     return True
-                    
-            except Exception as e:
-                logging.debug(f"Proxy validation failed for {proxy.get('original', 'unknown')}: {e}")
-                continue
-                
+
+        except Exception as e:
+            logger.debug("Proxy validation failed for %s: %s", proxy.get('original', 'unknown'), e)
+
         self.mark_proxy_failed(proxy)
+        self._store_verdict(proxy, False, 0.0)
         return False
-        
+
+    async def _validate_all_proxies_async(self, proxies: List[Dict[str, str]],
+                                          timeout: int = 10) -> int:
+        """Validate the given proxies concurrently inside one shared session"""
+        # Per-host cap stops the test endpoints from queueing our own
+        # requests; the semaphore bounds total in-flight checks instead of
+        # an overall connector limit
+        connector = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=4,
+            ssl=False,
+            enable_cleanup_closed=True
+        )
+        client_timeout = aiohttp.ClientTimeout(sock_connect=timeout, sock_read=timeout)
+        in_flight = asyncio.Semaphore(200)
+
+        async def bounded(proxy: Dict[str, str]) -> bool:
+            async with in_flight:
+                return await self._validate_proxy_async(session, proxy)
+
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=client_timeout,
+            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+        ) as session:
+            results = await asyncio.gather(
+                *(bounded(proxy) for proxy in proxies),
+                return_exceptions=True
+            )
+
+        return sum(1 for result in results if result is True)
+
     def validate_all_proxies(self, max_workers: int = 10):
         """Validate all proxies concurrently"""
         if not self.proxies:
-            logging.warning("No proxies to validate")
+            logger.warning("No proxies to validate")
             return
-            
-        logging.info(f"Validating {len(self.proxies)} proxies...")
-        
+
+        logger.info("Validating %d proxies...", len(self.proxies))
+
         start_time = time.time()
+
+        if aiohttp is not None:
+            # All checks fly at once on one event loop; wall time is bounded
+            # by the slowest proxy, not by a 10-thread pool. aiohttp's
+            # proxy= argument only speaks HTTP proxies, so socks-scheme
+            # entries go through the threaded requests path (which pysocks
+            # handles) instead of failing every async check
+            socks_proxies = [
+                proxy for proxy in self.proxies
+                if proxy.get('http', '').startswith('socks')
+            ]
+            http_proxies = [
+                proxy for proxy in self.proxies
+                if not proxy.get('http', '').startswith('socks')
+            ]
+            validated_count = 0
+            if http_proxies:
+                validated_count += asyncio.run(
+                    self._validate_all_proxies_async(http_proxies)
+                )
+            if socks_proxies:
+                validated_count += self._validate_all_proxies_threaded(
+                    max_workers, proxies=socks_proxies
+                )
+        else:
+            validated_count = self._validate_all_proxies_threaded(max_workers)
+
+        end_time = time.time()
+        validation_time = end_time - start_time
+
+        logger.info("Proxy validation completed: %d/%d working proxies in %.2fs", validated_count, len(self.proxies), validation_time)
+
+        # Sort working proxies by performance
+        with self.lock:
+            self.working_proxies.sort(key=lambda x: x.get('avg_response_time', 999))
+            self._refresh_snapshots()
+
+    def _validate_all_proxies_threaded(self, max_workers: int = 10,
+                                       proxies: Optional[List[Dict[str, str]]] = None) -> int:
+        """Thread-pool validation for proxies the async path can't carry
+        (socks schemes), and the full fallback when aiohttp is unavailable"""
+        if proxies is None:
+            proxies = self.proxies
         validated_count = 0
-        
+
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_to_proxy = {
                 executor.submit(self.validate_proxy, proxy): proxy
-                for proxy in self.proxies
+                for proxy in proxies
             }
-            
+
             for future in concurrent.futures.as_completed(future_to_proxy):
                 proxy = future_to_proxy[future]
                 try:
@@ -245,16 +575,10 @@ class ProxyManager:
                     if is_valid:
                         validated_count += 1
                 except Exception as e:
-                    logging.error(f"Proxy validation error: {e}")
+                    logger.error("Proxy validation error: %s", e)
                     self.mark_proxy_failed(proxy)
-                    
-        end_time = time.time()
-        validation_time = end_time - start_time
-        
-        logging.info(f"Proxy validation completed: {validated_count}/{len(self.proxies)} working proxies in {validation_time:.2f}s")
-        
-        # Sort working proxies by performance
-        self.working_proxies.sort(key=lambda x: x.get('avg_response_time', 999))
+
+        return validated_count
         
     def get_proxy_stats(self) -> Dict[str, Any]:
         """Get proxy statistics"""
@@ -273,57 +597,91 @@ class ProxyManager:
     def reset_failed_proxies(self):
         """Reset failed proxies (give them another chance)"""
         with self.lock:
-            for proxy in self.failed_proxies[:]:
+            for proxy in self.failed_proxies:
                 proxy['failures'] = 0
                 proxy['successes'] = 0
-                self.failed_proxies.remove(proxy)
-                
-            logging.info("Reset all failed proxies")
+
+            self.failed_proxies.clear()
+            self._failed_keys.clear()
+
+            logger.info("Reset all failed proxies")
             
     def add_proxy(self, proxy_string: str) -> bool:
         """Add a new proxy dynamically"""
         proxy = self._parse_proxy_line(proxy_string)
         if proxy:
             with self.lock:
+                if proxy['original'] in self._proxy_keys:
+                    logger.debug("Proxy already present: %s", proxy_string)
+                    return False
                 self.proxies.append(proxy)
-            logging.info(f"Added new proxy: {proxy_string}")
+                self._proxy_keys.add(proxy['original'])
+                self._refresh_snapshots()
+            logger.info("Added new proxy: %s", proxy_string)
             return True
         return False
         
     def remove_proxy(self, proxy_string: str) -> bool:
         """Remove a proxy"""
         with self.lock:
-            for proxy_list in [self.proxies, self.working_proxies, self.failed_proxies]:
+            removed = None
+
+            # A working proxy lives in both self.proxies and
+            # self.working_proxies; purge every list it appears in and
+            # only drop the key for lists it actually left, so the key
+            # sets stay exact mirrors
+            for proxy_list, key_set in (
+                (self.proxies, self._proxy_keys),
+                (self.working_proxies, self._working_keys),
+                (self.failed_proxies, self._failed_keys),
+            ):
                 for proxy in proxy_list[:]:
                     if proxy.get('original') == proxy_string:
                         proxy_list.remove(proxy)
-                        logging.info(f"Removed proxy: {proxy_string}")
-                        return True
+                        key_set.discard(proxy_string)
+                        removed = proxy
+
+            if removed is not None:
+                self._refresh_snapshots()
+
+                # Release the pooled validation session, if any
+                session = self._test_session_cache.pop(removed.get('http', ''), None)
+                if session is not None:
+                    session.close()
+
+                logger.info("Removed proxy: %s", proxy_string)
+                return True
         return False
         
     def save_working_proxies(self, filename: str = "working_proxies.txt"):
         """Save currently working proxies to a file"""
         try:
-            with open(filename, 'w') as f:
-                f.write(f"# Working proxies as of {datetime.now().isoformat()}\n")
-                f.write(f"# Total: {len(self.working_proxies)} proxies\n\n")
-                
-                for proxy in self.working_proxies:
-                    original = proxy.get('original', '')
-                    response_time = proxy.get('avg_response_time', 0)
-                    successes = proxy.get('successes', 0)
-                    failures = proxy.get('failures', 0)
-                    
-                    f.write(f"{original}  # RT: {response_time:.2f}s, Success: {successes}, Fail: {failures}\n")
-                    
-            logging.info(f"Saved {len(self.working_proxies)} working proxies to {filename}")
+            working = self._working_snapshot or tuple(self.working_proxies)
+
+            # Assemble the whole body in memory and flush it in one write
+            # instead of one syscall per proxy line
+            lines = [
+                f"# Working proxies as of {datetime.now().isoformat()}",
+                f"# Total: {len(working)} proxies",
+                ""
+            ]
+            lines.extend(
+                f"{proxy.get('original', '')}  # RT: {proxy.get('avg_response_time', 0):.2f}s, "
+                f"Success: {proxy.get('successes', 0)}, Fail: {proxy.get('failures', 0)}"
+                for proxy in working
+            )
+
+            Path(filename).write_text('\n'.join(lines) + '\n')
+
+            logger.info("Saved %d working proxies to %s", len(working), filename)
             return True
             
         except Exception as e:
-            logging.error(f"Error saving working proxies: {e}")
+            logger.error("Error saving working proxies: %s", e)
             return False
             
-    def test_proxy_connectivity(self, proxy: Dict[str, str], target_url: str = None) -> Dict[str, Any]:
+    def test_proxy_connectivity(self, proxy: Dict[str, str], target_url: str = None,
+                                include_ip: bool = False) -> Dict[str, Any]:
         """Test proxy connectivity to specific target"""
         if not target_url:
             target_url = "https://www.google.com"
@@ -338,52 +696,84 @@ class ProxyManager:
             'ip_address': None
         }
         
+        session = self._get_test_session(proxy)
+        proxies = proxy.get('requests_dict', proxy)
+
         try:
             start_time = time.time()
-            
-            response = requests.get(
+
+            response = session.get(
                 target_url,
-                proxies=proxy,
-                timeout=15,
-                headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+                proxies=proxies,
+                timeout=15
             )
-            
+
             result['response_time'] = time.time() - start_time
             result['status_code'] = response.status_code
             result['success'] = response.status_code == 200
-            
-            # Try to get IP address
-            try:
-                ip_response = requests.get(
-                    'https://api.ipify.org?format=json',
-                    proxies=proxy,
-                    timeout=10
-                )
-                if ip_response.status_code == 200:
-                    result['ip_address'] = ip_response.json().get('ip')
-            except:
-                pass
-                
+
+            # Exit IP lookup costs an extra request + JSON parse; opt-in only
+            if include_ip:
+                try:
+                    ip_response = session.get(
+                        'https://api.ipify.org?format=json',
+                        proxies=proxies,
+                        timeout=10
+                    )
+                    if ip_response.status_code == 200:
+                        result['ip_address'] = ip_response.json().get('ip')
+                except:
+                    pass
+
         except Exception as e:
             result['error'] = str(e)
             
         return result
         
+    def _note_weight_change(self):
+        """Record a performance update; rebuild the weight table in batches"""
+        self._weight_changes += 1
+        if self._weight_changes >= 32:
+            self._recompute_weights()
+
+    def _recompute_weights(self):
+        """Rebuild the cumulative-weight table from working-proxy stats.
+
+        A proxy's weight is the inverse of its failure rate and response
+        time, so fast reliable proxies are drawn proportionally more often.
+        """
+        refs = tuple(self.working_proxies)
+        cum = array('d')
+        total = 0.0
+
+        for proxy in refs:
+            failure_rate = proxy.get('failures', 0) / max(proxy.get('successes', 1), 1)
+            response_time = proxy.get('avg_response_time', 0) or 0.05
+            total += 1.0 / ((1.0 + failure_rate) * response_time)
+            cum.append(total)
+
+        self._weight_table = (refs, cum, total)
+        self._weight_changes = 0
+
     def get_best_proxy(self) -> Optional[Dict[str, str]]:
-        """Get the best performing proxy"""
+        """Get a top-performing proxy via weighted sampling"""
         if not self.working_proxies:
             return None
-            
-        # Sort by success rate and response time
-        best_proxy = min(
-            self.working_proxies,
-            key=lambda x: (
-                x.get('failures', 0) / max(x.get('successes', 1), 1),  # Failure rate
-                x.get('avg_response_time', 999)  # Response time
-            )
-        )
-        
-        return best_proxy
+
+        if len(self._weight_table[0]) != len(self.working_proxies):
+            with self.lock:
+                self._recompute_weights()
+
+        # One load of the published tuple keeps refs, cumulative weights
+        # and total from the same generation even if a writer swaps the
+        # table mid-draw
+        refs, cum_weights, total = self._weight_table
+        if not refs or total <= 0:
+            return self.working_proxies[0]
+
+        # O(log N) draw over the cumulative table; min() rescanned O(N)
+        index = bisect_left(cum_weights, random.random() * total)
+        return refs[min(index, len(refs) - 1)]
         
     def cleanup_old_performance_data(self, days: int = 7):
         """Clean up old performance data"""
@@ -396,4 +786,6 @@ class ProxyManager:
                     # Reset performance counters for old data
                     proxy['failures'] = 0
                     proxy['successes'] = 0
-                    proxy['avg_response_time'] = 0
\ No newline at end of file
+                    proxy['avg_response_time'] = 0
+                    proxy['rt_sum'] = 0.0
+                    proxy['rt_count'] = 0
\ No newline at end of file
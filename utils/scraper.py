@@ -6,7 +6,8 @@ Date: September 2025
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter, Retry
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -18,12 +19,184 @@ from selenium.webdriver.chrome.service import Service
 import time
 import random
 import logging
+import threading
+import queue
+import atexit
+import shutil
+import tempfile
+import heapq
+import itertools
+import concurrent.futures
 from typing import Dict, List, Optional, Any
 import re
 from urllib.parse import urljoin, urlparse, quote_plus
 import os
 import json
 from datetime import datetime
+from functools import lru_cache
+from collections import OrderedDict
+from contextlib import contextmanager
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+# Google SERPs run to hundreds of KB but only the <div class="g"> result
+# blocks matter; straining at parse time keeps the rest out of the DOM
+_GOOGLE_RESULT_STRAINER = SoupStrainer('div', class_='g')
+
+# Google's explicit "nothing indexed" message; when the site: query comes
+# back with this, query variations against the same index are pointless
+_NO_RESULTS_RE = re.compile(r'did not match any documents', re.IGNORECASE)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket for polite request pacing.
+
+    consume() blocks until a token is available, so any number of
+    concurrent workers share one steady request rate toward a host
+    instead of each sleeping its own fixed jitter.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class _DriverPool:
+    """Process-wide pool of idle Chrome instances plus the resolved
+    chromedriver path.
+
+    ChromeDriverManager().install() performs a network version check, so
+    its result is cached for the life of the process; released browsers
+    are parked here instead of quit, and the next acquire reuses one
+    instead of paying Chrome startup again. Every launch gets its own
+    throwaway profile directory, removed again when the driver is quit.
+    """
+
+    _path: Optional[str] = None
+    _path_lock = threading.Lock()
+    _pool: queue.Queue = queue.Queue()
+    _profiles: Dict[int, str] = {}
+
+    @classmethod
+    def driver_path(cls) -> str:
+        if cls._path is None:
+            with cls._path_lock:
+                if cls._path is None:
+                    # An explicit CHROMEDRIVER_PATH skips the manager's
+                    # version check (a network call) on CLI cold starts
+                    cls._path = (os.environ.get('CHROMEDRIVER_PATH')
+                                 or ChromeDriverManager().install())
+        return cls._path
+
+    @classmethod
+    def launch(cls, chrome_options: Options):
+        """Start Chrome against a freshly-created private profile dir.
+
+        Concurrent drivers cannot share one --user-data-dir — Chrome
+        refuses the second launch against a profile already in use —
+        and mkdtemp yields a 0700 directory instead of a predictable
+        world-readable /tmp path.
+        """
+        profile_dir = tempfile.mkdtemp(prefix='chrome-osint-')
+        chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+        try:
+            driver = webdriver.Chrome(service=Service(cls.driver_path()), options=chrome_options)
+        except Exception:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+            raise
+        cls._profiles[id(driver)] = profile_dir
+        return driver
+
+    @classmethod
+    def quit(cls, driver):
+        """Quit a driver and remove its profile directory"""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        profile_dir = cls._profiles.pop(id(driver), None)
+        if profile_dir:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+
+    @classmethod
+    def acquire(cls, chrome_options: Options):
+        try:
+            return cls._pool.get_nowait()
+        except queue.Empty:
+            return cls.launch(chrome_options)
+
+    @classmethod
+    def release(cls, driver):
+        cls._pool.put(driver)
+
+    @classmethod
+    def drain(cls):
+        while True:
+            try:
+                driver = cls._pool.get_nowait()
+            except queue.Empty:
+                break
+            cls.quit(driver)
+
+
+atexit.register(_DriverPool.drain)
+
+
+def _page_fingerprint(text: str) -> int:
+    """Cheap content hash for skipping re-parses of identical responses.
+
+    xxhash runs at memory speed when available; the builtin hash is a
+    fine fallback since collisions only cost one redundant parse.
+    """
+    if xxhash is not None:
+        return xxhash.xxh64(text.encode('utf-8', 'ignore')).intdigest()
+    return hash(text)
+
+
+@lru_cache(maxsize=4096)
+def _google_search_url(query: str) -> str:
+    """Quoted Google search URL for a query, built once per unique query."""
+    return f"https://www.google.com/search?q={quote_plus(query)}"
+
+
+@lru_cache(maxsize=256)
+def _email_regex(email: str) -> re.Pattern:
+    """Compiled case-insensitive pattern for one email address.
+
+    Escaped so '.' and '+' in the address match literally, and cached so
+    batch scans compile it once per email rather than once per page.
+    """
+    return re.compile(re.escape(email), re.IGNORECASE)
 
 
 class EmailScraper:
@@ -31,7 +204,20 @@ class EmailScraper:
     
     def __init__(self, proxy_manager=None):
         self.proxy_manager = proxy_manager
-        self.session = requests.Session()
+
+        # Persist GET responses to SQLite when requests-cache is present:
+        # repeated runs against the same email answer identical queries
+        # from disk instead of re-spending Google's rate limit
+        if requests_cache is not None:
+            self.session = requests_cache.CachedSession(
+                '.email_osint_cache',
+                backend='sqlite',
+                expire_after=3600,
+                allowable_methods=('GET',)
+            )
+        else:
+            self.session = requests.Session()
+
         self.driver = None
 
         # User agents for rotation (MOVED UP HERE TO FIX THE ATTRIBUTE ERROR)
@@ -43,69 +229,237 @@ class EmailScraper:
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/119.0',
         ]
         
+        # Short-TTL LRU page cache keyed on URL; identical Google queries
+        # for the same (email, domain) pair are answered without a round
+        # trip, and the size cap keeps at most _page_cache_max full
+        # Response objects pinned at once
+        self._page_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._page_cache_ttl = 1800
+        self._page_cache_max = 1024
+
+        # Optional JSON search backend; when a SerpAPI key is configured,
+        # Google queries skip SERP HTML and BS4 entirely
+        self._serpapi_key = os.environ.get('SERPAPI_KEY')
+
+        # At most two in-flight SERP fetches regardless of how wide
+        # search_many fans out — platform requests spread across hosts,
+        # but every Google query hits the same rate limiter
+        self._google_sem = threading.Semaphore(2)
+
+        # Deterministic UA rotation; next() on a cycle under a small lock
+        # avoids contending on the random module's shared state from
+        # many worker threads
+        self._ua_iter = itertools.cycle(self.user_agents)
+        self._ua_lock = threading.Lock()
+
+        # Pacing toward Google (~1 request per 2s, small burst) and the
+        # direct platform endpoints; shared buckets replace per-call
+        # random sleeps so concurrent workers stay polite collectively
+        self._google_limiter = _TokenBucket(rate=0.5, capacity=2)
+        self._platform_limiter = _TokenBucket(rate=1.0, capacity=2)
+
         self.setup_session()  # Now safe to call after user_agents is set
-        
+
+    def _next_ua(self) -> str:
+        """Next user agent in the rotation"""
+        with self._ua_lock:
+            return next(self._ua_iter)
+
     def setup_session(self):
         """Setup requests session with headers and proxy"""
         headers = {
-            'User-Agent': random.choice(self.user_agents),
+            'User-Agent': self._next_ua(),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': 'gzip, deflate, br',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         }
         self.session.headers.update(headers)
-        
+
+        # Default adapters pool 10 connections; with search_many running
+        # several platforms at once that means fresh TCP+TLS handshakes
+        # mid-run. A larger pool plus bounded retries on transient
+        # status codes keeps sockets warm across threads.
+        adapter = HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         # Set proxy if available
         if self.proxy_manager and self.proxy_manager.has_proxies():
             proxy = self.proxy_manager.get_proxy()
             if proxy:
                 self.session.proxies.update(proxy)
                 
+    def _build_chrome_options(self, headless=True) -> Options:
+        """Chrome options shared by the instance driver and the pool"""
+        chrome_options = Options()
+
+        # Basic options
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        
+        # Startup cost: skip first-run tasks, extensions and background
+        # traffic the scraper never needs (the per-launch profile dir is
+        # added by _DriverPool.launch — sharing one dir blocks concurrent
+        # drivers)
+        chrome_options.add_argument('--no-first-run')
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-background-networking')
+
+        # Text is all we scrape; skip image decode and return from
+        # driver.get as soon as the HTML is parsed
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        chrome_options.page_load_strategy = 'eager'
+
+        if headless:
+            chrome_options.add_argument('--headless')
+
+        # Window size
+        chrome_options.add_argument('--window-size=1920,1080')
+        
+        # User agent
+        chrome_options.add_argument(f'--user-agent={self._next_ua()}')
+        
+        # Proxy setup
+        if self.proxy_manager and self.proxy_manager.has_proxies():
+            proxy = self.proxy_manager.get_proxy_string()
+            if proxy:
+                chrome_options.add_argument(f'--proxy-server={proxy}')
+
+        return chrome_options
+
     def get_selenium_driver(self, headless=True):
         """Initialize Selenium WebDriver with proper options"""
         if self.driver:
             return self.driver
-            
+
         try:
-            chrome_options = Options()
-            
-            # Basic options
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            if headless:
-                chrome_options.add_argument('--headless')
-                
-            # Window size
-            chrome_options.add_argument('--window-size=1920,1080')
-            
-            # User agent
-            chrome_options.add_argument(f'--user-agent={random.choice(self.user_agents)}')
-            
-            # Proxy setup
-            if self.proxy_manager and self.proxy_manager.has_proxies():
-                proxy = self.proxy_manager.get_proxy_string()
-                if proxy:
-                    chrome_options.add_argument(f'--proxy-server={proxy}')
-                    
+            chrome_options = self._build_chrome_options(headless)
+
             # Initialize driver
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            
+            self.driver = _DriverPool.launch(chrome_options)
+
             # Execute script to remove webdriver property
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
+
+            self._block_static_assets(self.driver)
+
             return self.driver
-            
+
         except Exception as e:
             logging.error(f"Failed to initialize Chrome driver: {e}")
             return None
-            
+
+    @staticmethod
+    def _block_static_assets(driver):
+        """Drop image/font/CSS fetches at the network layer — the text the
+        scraper reads never needs them"""
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {
+                'urls': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.woff*', '*.css']
+            })
+        except Exception as e:
+            logging.debug(f"CDP asset blocking unavailable: {e}")
+
+    def acquire_driver(self, headless=True):
+        """Take a browser from the shared pool (or start one if idle is
+        empty); pair with release_driver to park it for the next caller"""
+        try:
+            driver = _DriverPool.acquire(self._build_chrome_options(headless))
+        except Exception as e:
+            logging.error(f"Failed to acquire Chrome driver: {e}")
+            return None
+
+        self._block_static_assets(driver)
+        return driver
+
+    def release_driver(self, driver):
+        """Return a pooled browser without quitting it"""
+        if driver is not None:
+            try:
+                driver.delete_all_cookies()
+            except Exception as e:
+                logging.debug(f"Error resetting pooled driver: {e}")
+            _DriverPool.release(driver)
+
+    @contextmanager
+    def new_tab(self):
+        """Run one page visit in a throwaway tab on the shared driver.
+
+        Opening a tab costs only navigation time, where spawning a fresh
+        Chrome per visit pays process startup and hundreds of MB of RAM.
+        Yields the driver focused on the new tab, then closes the tab and
+        returns focus to the original window.
+        """
+        driver = self.get_selenium_driver()
+        if driver is None:
+            yield None
+            return
+
+        original_window = driver.current_window_handle
+        driver.switch_to.new_window('tab')
+
+        try:
+            yield driver
+        finally:
+            try:
+                driver.close()
+                driver.switch_to.window(original_window)
+            except WebDriverException as e:
+                logging.debug(f"Error closing tab: {e}")
+
+    def _cached_get(self, url: str, timeout: int = 15, limiter: _TokenBucket = None):
+        """GET through the session with a short TTL cache on the URL.
+
+        Cache hits skip both the HTTP round trip and the rate limiter,
+        so repeated queries (same email against the same domain) cost
+        nothing after the first fetch.
+        """
+        # pop + reinsert refreshes the entry's LRU position without a
+        # separate move_to_end that could race a concurrent eviction
+        hit = self._page_cache.pop(url, None)
+        if hit is not None and time.monotonic() - hit[1] < self._page_cache_ttl:
+            self._page_cache[url] = hit
+            return hit[0]
+
+        if limiter is not None:
+            limiter.consume()
+
+        # Rotate the UA per request via a header override; replacing the
+        # session would throw away its warm connection pool
+        response = self.session.get(
+            url,
+            timeout=timeout,
+            headers={'User-Agent': self._next_ua()}
+        )
+
+        if response.status_code == 200:
+            self._page_cache[url] = (response, time.monotonic())
+            # O(1) least-recently-used eviction keeps the cache bounded
+            # even when every entry is still inside its TTL
+            while len(self._page_cache) > self._page_cache_max:
+                self._page_cache.popitem(last=False)
+
+        return response
+
     def search_email_on_platform(self, email: str, platform: Dict) -> Dict:
         """Search for email on a specific platform"""
         platform_name = platform.get('name', 'Unknown')
@@ -118,20 +472,23 @@ class EmailScraper:
             result = None
             
             # Method 1: Google site search
-            result = self._google_site_search(email, platform)
-            if result and result.get('matches'):
-                return result
-                
+            site_result = self._google_site_search(email, platform)
+            if site_result and site_result.get('matches'):
+                return site_result
+
             # Method 2: Platform direct search (if not login required)
             if not platform.get('login_required', False):
                 result = self._direct_platform_search(email, platform)
                 if result and result.get('matches'):
                     return result
-                    
-            # Method 3: Advanced Google search with variations
-            result = self._advanced_google_search(email, platform)
-            if result and result.get('matches'):
-                return result
+
+            # Method 3: Advanced Google search with variations — skipped
+            # when Google already said nothing on the site matched at
+            # all, since the variations query the same empty index
+            if not (site_result and site_result.get('exhaustive')):
+                result = self._advanced_google_search(email, platform)
+                if result and result.get('matches'):
+                    return result
                 
             # No results found
             return {
@@ -152,53 +509,145 @@ class EmailScraper:
                 'search_time': datetime.now().isoformat()
             }
             
+    def search_many(self, email: str, platforms: List[Dict], max_workers: int = 8) -> List[Dict]:
+        """Search several platforms concurrently.
+
+        The per-platform pipeline is network-bound, so fanning it out
+        across a small thread pool cuts wall time roughly by the worker
+        count instead of paying each platform's round trips serially.
+        """
+        if not platforms:
+            return []
+
+        max_workers = min(max_workers, len(platforms))
+        results = []
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_platform = {
+                executor.submit(self.search_email_on_platform, email, platform): platform
+                for platform in platforms
+            }
+
+            for future in concurrent.futures.as_completed(future_to_platform):
+                platform = future_to_platform[future]
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logging.error(f"Error searching {platform.get('name', 'Unknown')}: {e}")
+                    results.append({
+                        'platform': platform.get('name', 'Unknown'),
+                        'url': platform.get('url', ''),
+                        'status': 'error',
+                        'error': str(e),
+                        'search_time': datetime.now().isoformat()
+                    })
+
+        return results
+
+    def _fetch_serpapi_results(self, query: str, limit: int) -> List[tuple]:
+        """Fetch pre-parsed Google results from SerpAPI's JSON endpoint.
+
+        A few KB of JSON replaces ~200KB of SERP HTML plus the BS4 pass,
+        and the results don't break when Google rotates class names.
+        """
+        response = self.session.get(
+            'https://serpapi.com/search.json',
+            params={'q': query, 'num': limit, 'api_key': self._serpapi_key},
+            timeout=15
+        )
+        response.raise_for_status()
+
+        return [
+            (item.get('title', ''), item.get('link', ''), item.get('snippet', ''))
+            for item in response.json().get('organic_results', [])[:limit]
+        ]
+
+    def _fetch_google_results(self, query: str, limit: int) -> tuple:
+        """Run one Google query, returning (triples, exhaustive).
+
+        triples are (title, url, snippet); exhaustive is True when the
+        SERP carried Google's "did not match any documents" message,
+        meaning the index has nothing for this query and rephrasing it
+        won't help. Shared by both Google search paths so the
+        fetch+strain+extract pipeline exists once and identical queries
+        hit the same cache. Uses the SerpAPI JSON backend when a key is
+        configured, falling back to SERP HTML scraping otherwise.
+        """
+        if self._serpapi_key:
+            try:
+                return self._fetch_serpapi_results(query, limit), False
+            except Exception as e:
+                logging.debug(f"SerpAPI query failed, falling back to HTML: {e}")
+
+        with self._google_sem:
+            response = self._cached_get(
+                _google_search_url(query), timeout=15, limiter=self._google_limiter
+            )
+        response.raise_for_status()
+
+        # Checked before slicing in case the message sits outside the
+        # results container
+        html = response.text
+        exhaustive = _NO_RESULTS_RE.search(html) is not None
+
+        # Most SERP bytes are inline JS/CSS before the results container;
+        # slicing to the <div id="search"> region shrinks what even the
+        # strained parse has to scan
+        start = html.find('<div id="search"')
+        end = html.rfind('</body>')
+        if start != -1 and end != -1:
+            html = html[start:end]
+
+        soup = BeautifulSoup(html, 'lxml', parse_only=_GOOGLE_RESULT_STRAINER)
+        results = []
+
+        for result in soup.find_all('div', class_='g')[:limit]:
+            try:
+                title_elem = result.find('h3')
+                link_elem = result.find('a')
+                snippet_elem = result.find('span', class_='st') or result.find('div', class_='s')
+
+                if title_elem and link_elem:
+                    results.append((
+                        title_elem.get_text(strip=True),
+                        link_elem.get('href', ''),
+                        snippet_elem.get_text(strip=True) if snippet_elem else ''
+                    ))
+
+            except Exception as e:
+                logging.debug(f"Error parsing search result: {e}")
+                continue
+
+        # Everything needed has been copied out into plain strings; tear
+        # the tree down now rather than when the GC gets to it, which
+        # matters once searches run on many workers at once
+        soup.decompose()
+
+        return results, exhaustive
+
     def _google_site_search(self, email: str, platform: Dict) -> Dict:
         """Search using Google site: operator"""
         platform_name = platform.get('name', 'Unknown')
         platform_url = platform.get('url', '')
-        
+
         try:
             # Build Google search query
             query = f'site:{platform_url} "{email}"'
-            google_url = f"https://www.google.com/search?q={quote_plus(query)}"
-            
-            # Add random delay
-            time.sleep(random.uniform(1, 3))
-            
-            response = self.session.get(google_url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            pattern = _email_regex(email)
             matches = []
-            
-            # Parse Google search results
-            search_results = soup.find_all('div', class_='g')
-            
-            for result in search_results[:5]:  # Limit to first 5 results
-                try:
-                    title_elem = result.find('h3')
-                    link_elem = result.find('a')
-                    snippet_elem = result.find('span', class_='st') or result.find('div', class_='s')
-                    
-                    if title_elem and link_elem:
-                        title = title_elem.get_text(strip=True)
-                        link = link_elem.get('href', '')
-                        snippet = snippet_elem.get_text(strip=True) if snippet_elem else ''
-                        
-                        # Check if email is mentioned in results
-                        if email.lower() in (title.lower() + ' ' + snippet.lower()):
-                            matches.append({
-                                'title': title,
-                                'url': link,
-                                'snippet': snippet,
-                                'confidence': 0.8,
-                                'source': 'google_site_search'
-                            })
-                            
-                except Exception as e:
-                    logging.debug(f"Error parsing search result: {e}")
-                    continue
-                    
+
+            results, exhaustive = self._fetch_google_results(query, 5)
+            for title, link, snippet in results:
+                # Check if email is mentioned in results
+                if pattern.search(title) or pattern.search(snippet):
+                    matches.append({
+                        'title': title,
+                        'url': link,
+                        'snippet': snippet,
+                        'confidence': 0.8,
+                        'source': 'google_site_search'
+                    })
+
             status = 'found' if matches else 'not_found'
             
             return {
@@ -206,6 +655,7 @@ class EmailScraper:
                 'url': platform_url,
                 'status': status,
                 'matches': matches,
+                'exhaustive': exhaustive,
                 'search_method': 'google_site_search',
                 'search_time': datetime.now().isoformat()
             }
@@ -235,15 +685,29 @@ class EmailScraper:
             ]
             
             matches = []
-            
+            seen_fingerprints = set()
+
             for params in search_params:
                 try:
-                    time.sleep(random.uniform(1, 2))
-                    
-                    response = self.session.get(search_url, params=params, timeout=15)
+                    self._platform_limiter.consume()
+
+                    response = self.session.get(
+                        search_url,
+                        params=params,
+                        timeout=15,
+                        headers={'User-Agent': self._next_ua()}
+                    )
                     if response.status_code == 200:
+                        # Platforms that ignore unknown query params return
+                        # the same page for every variant; hash it and skip
+                        # re-parsing repeats
+                        fingerprint = _page_fingerprint(response.text)
+                        if fingerprint in seen_fingerprints:
+                            continue
+                        seen_fingerprints.add(fingerprint)
+
                         matches.extend(self._parse_platform_results(response.text, email, platform))
-                        
+
                     if matches:  # Stop if we found results
                         break
                         
@@ -284,50 +748,39 @@ class EmailScraper:
             ]
             
             all_matches = []
-            
+            seen_queries = set()
+
             for query in queries:
+                # Variations can collapse to the same query text
+                if query in seen_queries:
+                    continue
+                seen_queries.add(query)
+
                 try:
-                    google_url = f"https://www.google.com/search?q={quote_plus(query)}"
-                    time.sleep(random.uniform(2, 4))
-                    
-                    response = self.session.get(google_url, timeout=15)
-                    response.raise_for_status()
-                    
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    search_results = soup.find_all('div', class_='g')
-                    
-                    for result in search_results[:3]:
+                    triples, _ = self._fetch_google_results(query, 3)
+                    for title, link, snippet in triples:
                         try:
-                            title_elem = result.find('h3')
-                            link_elem = result.find('a')
-                            snippet_elem = result.find('span', class_='st') or result.find('div', class_='s')
-                            
-                            if title_elem and link_elem:
-                                title = title_elem.get_text(strip=True)
-                                link = link_elem.get('href', '')
-                                snippet = snippet_elem.get_text(strip=True) if snippet_elem else ''
-                                
-                                # Check for email variations
-                                content = (title + ' ' + snippet).lower()
-                                confidence = 0.3
-                                
-                                if email.lower() in content:
-                                    confidence = 0.9
-                                elif username.lower() in content:
-                                    confidence = 0.6
-                                elif domain.lower() in content:
-                                    confidence = 0.4
-                                    
-                                if confidence > 0.3:
-                                    all_matches.append({
-                                        'title': title,
-                                        'url': link,
-                                        'snippet': snippet,
-                                        'confidence': confidence,
-                                        'source': 'advanced_google_search',
-                                        'query_used': query
-                                    })
-                                    
+                            # Check for email variations
+                            content = (title + ' ' + snippet).lower()
+                            confidence = 0.3
+
+                            if email.lower() in content:
+                                confidence = 0.9
+                            elif username.lower() in content:
+                                confidence = 0.6
+                            elif domain.lower() in content:
+                                confidence = 0.4
+
+                            if confidence > 0.3:
+                                all_matches.append({
+                                    'title': title,
+                                    'url': link,
+                                    'snippet': snippet,
+                                    'confidence': confidence,
+                                    'source': 'advanced_google_search',
+                                    'query_used': query
+                                })
+
                         except Exception as e:
                             logging.debug(f"Error parsing advanced search result: {e}")
                             continue
@@ -335,23 +788,32 @@ class EmailScraper:
                 except Exception as e:
                     logging.debug(f"Advanced query '{query}' failed: {e}")
                     continue
-                    
-            # Remove duplicates and sort by confidence
-            unique_matches = []
-            seen_urls = set()
-            
-            for match in sorted(all_matches, key=lambda x: x['confidence'], reverse=True):
-                if match['url'] not in seen_urls:
-                    unique_matches.append(match)
-                    seen_urls.add(match['url'])
-                    
+
+                # A full-email hit is as good as this method gets; the
+                # remaining variations would only add lower-confidence noise
+                if any(match['confidence'] >= 0.9 for match in all_matches):
+                    break
+
+
+            # Keep the best-confidence match per URL in one pass, then pick
+            # the top 5 without sorting the whole list
+            best_by_url = {}
+            for match in all_matches:
+                previous = best_by_url.get(match['url'])
+                if previous is None or match['confidence'] > previous['confidence']:
+                    best_by_url[match['url']] = match
+
+            unique_matches = heapq.nlargest(
+                5, best_by_url.values(), key=lambda x: x['confidence']
+            )
+
             status = 'potential_match' if unique_matches else 'not_found'
-            
+
             return {
                 'platform': platform_name,
                 'url': platform_url,
                 'status': status,
-                'matches': unique_matches[:5],  # Limit to top 5
+                'matches': unique_matches,
                 'search_method': 'advanced_google_search',
                 'search_time': datetime.now().isoformat()
             }
@@ -365,36 +827,56 @@ class EmailScraper:
         matches = []
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Generic patterns for finding email mentions
-            text_content = soup.get_text().lower()
-            
-            if email.lower() in text_content:
-                # Try to find specific elements containing the email
-                for element in soup.find_all(['div', 'span', 'p', 'a']):
-                    element_text = element.get_text()
-                    if email.lower() in element_text.lower():
-                        matches.append({
-                            'content': element_text.strip()[:200],
-                            'element_type': element.name,
-                            'confidence': 0.8,
-                            'source': 'direct_platform_content'
-                        })
-                        
-                        if len(matches) >= 3:  # Limit matches
-                            break
-                            
+            pattern = _email_regex(email)
+
+            # Fast scan of the raw markup first: if the email isn't in the
+            # page at all (the common case), skip DOM construction entirely
+            if not pattern.search(html_content):
+                return matches
+
+            soup = BeautifulSoup(html_content, 'lxml')
+
+            # Match the text nodes containing the email directly instead of
+            # walking every element and re-serializing its subtree; the
+            # context window is sliced straight out of the matched string
+            for node in soup.find_all(string=pattern, limit=3):
+                node_text = str(node)
+                hit = pattern.search(node_text)
+                start = max(0, hit.start() - 100)
+                content = node_text[start:hit.end() + 100].strip()[:200]
+
+                matches.append({
+                    'content': content,
+                    'element_type': node.parent.name if node.parent else 'text',
+                    'confidence': 0.8,
+                    'source': 'direct_platform_content'
+                })
+
+            # Matches hold plain strings only; free the tree eagerly
+            soup.decompose()
+
         except Exception as e:
             logging.debug(f"Error parsing platform results: {e}")
             
         return matches
         
+    def clear_cache(self):
+        """Drop cached pages — the in-memory TTL map and, when the session
+        is backed by requests-cache, the on-disk HTTP cache too."""
+        self._page_cache.clear()
+
+        cache = getattr(self.session, 'cache', None)
+        if cache is not None:
+            try:
+                cache.clear()
+            except Exception as e:
+                logging.debug(f"Error clearing HTTP cache: {e}")
+
     def close(self):
         """Clean up resources"""
         if self.driver:
             try:
-                self.driver.quit()
+                _DriverPool.quit(self.driver)
             except Exception as e:
                 logging.error(f"Error closing WebDriver: {e}")
                 